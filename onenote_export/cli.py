@@ -1,22 +1,32 @@
 """CLI entry point for the OneNote exporter."""
 
 import argparse
+import contextlib
+import functools
+import itertools
 import logging
-import re
+import os
 import sys
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from onenote_export.converter.html import HTMLConverter
 from onenote_export.converter.markdown import MarkdownConverter
 from onenote_export.model.notebook import Notebook
+from onenote_export.model.section import Section
 from onenote_export.parser.content_extractor import extract_section
 from onenote_export.parser.one_store import OneStoreParser
 from onenote_export.utils import (
     discover_one_files,
     notebook_name_from_dir,
+    section_date_from_filename,
     section_name_from_filename,
 )
 
+_LOG_FORMAT = "%(levelname)s: %(message)s"
+
 
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for the onenote-export CLI."""
@@ -59,6 +69,16 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Output flat directory structure (no notebook subdirectories)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=os.cpu_count() or 1,
+        help=(
+            "Number of sections to parse in parallel (default: CPU count); "
+            "memory use grows with the number of jobs"
+        ),
+    )
 
     args = parser.parse_args(argv)
 
@@ -70,10 +90,7 @@ def main(argv: list[str] | None = None) -> int:
     else:
         log_level = logging.WARNING
 
-    logging.basicConfig(
-        level=log_level,
-        format="%(levelname)s: %(message)s",
-    )
+    logging.basicConfig(level=log_level, format=_LOG_FORMAT)
 
     input_dir = Path(args.input).resolve()
     output_dir = Path(args.output).resolve()
@@ -98,66 +115,79 @@ def main(argv: list[str] | None = None) -> int:
         converters.append(HTMLConverter(output_dir))
 
     # Group files by parent directory (notebook)
-    notebooks: dict[Path, list[Path]] = {}
+    grouped: dict[Path, list[Path]] = {}
     for f in one_files:
         parent = f.parent
-        notebooks.setdefault(parent, []).append(f)
+        grouped.setdefault(parent, []).append(f)
 
     # Deduplicate: keep only the latest version of each section
-    for notebook_dir in notebooks:
-        notebooks[notebook_dir] = _deduplicate_sections(notebooks[notebook_dir])
-
-    # Process each notebook
-    total_files = 0
-    total_pages = 0
-    errors: list[str] = []
-
-    for notebook_dir, section_files in sorted(notebooks.items()):
-        notebook_name = notebook_name_from_dir(notebook_dir)
-        print(f"\nProcessing notebook: {notebook_name}")
-
-        notebook = Notebook(
-            name=notebook_name,
-            dir_path=str(notebook_dir),
-        )
-
-        for section_file in sorted(section_files):
-            section_name = section_name_from_filename(section_file.name)
-            print(f"  Section: {section_name} ({section_file.name})")
-
-            try:
-                store_parser = OneStoreParser(section_file)
-                parsed = store_parser.parse()
+    notebooks: dict[Path, list[tuple[Path, str]]] = {
+        notebook_dir: _deduplicate_sections(files)
+        for notebook_dir, files in grouped.items()
+    }
+
+    # Sections in the order they are written.  Each .one file is parsed
+    # independently; _parse_sections yields one loader per file, in order.
+    ordered = [
+        (notebook_dir, sorted(sections))
+        for notebook_dir, sections in sorted(notebooks.items())
+    ]
+    section_files = [f for _, sections in ordered for f, _ in sections]
+    loaders = _parse_sections(section_files, args.jobs, log_level)
+    with contextlib.closing(loaders):
+        # Process each notebook
+        total_files = 0
+        total_pages = 0
+        errors: list[str] = []
+
+        for notebook_dir, sections in ordered:
+            notebook_name = notebook_name_from_dir(notebook_dir)
+            # Progress lines are buffered and written once per notebook
+            # rather than one print() per section.
+            report = [f"\nProcessing notebook: {notebook_name}"]
+
+            notebook = Notebook(
+                name=notebook_name,
+                dir_path=str(notebook_dir),
+            )
 
-                section = extract_section(parsed)
-                section.name = section_name
+            for section_file, section_name in sections:
+                report.append(f"  Section: {section_name} ({section_file.name})")
+                load_section = next(loaders)
 
-                notebook.sections.append(section)
-                page_count = len(section.pages)
-                total_pages += page_count
-                print(f"    -> {page_count} page(s) extracted")
+                try:
+                    section = load_section()
+                    section.name = section_name
 
-            except Exception as e:
-                error_msg = f"    ERROR: {section_file.name}: {e}"
-                print(error_msg, file=sys.stderr)
-                errors.append(error_msg)
-                logging.debug("Full traceback:", exc_info=True)
+                    notebook.sections.append(section)
+                    page_count = len(section.pages)
+                    total_pages += page_count
+                    report.append(f"    -> {page_count} page(s) extracted")
 
-        # Write the notebook with each converter
-        if notebook.sections:
-            for converter in converters:
-                try:
-                    if args.flat:
-                        for section in notebook.sections:
-                            files = converter.convert_section(section)
-                            total_files += len(files)
-                    else:
-                        files = converter.convert_notebook(notebook)
-                        total_files += len(files)
                 except Exception as e:
-                    error_msg = f"  ERROR writing notebook {notebook_name}: {e}"
-                    print(error_msg, file=sys.stderr)
+                    error_msg = f"    ERROR: {section_file.name}: {e}"
+                    _write_error(report, error_msg)
                     errors.append(error_msg)
+                    logging.debug("Full traceback:", exc_info=True)
+
+            # Write the notebook with each converter
+            if notebook.sections:
+                for converter in converters:
+                    try:
+                        if args.flat:
+                            for section in notebook.sections:
+                                files = converter.convert_section(section)
+                                total_files += len(files)
+                        else:
+                            files = converter.convert_notebook(notebook)
+                            total_files += len(files)
+                    except Exception as e:
+                        error_msg = f"  ERROR writing notebook {notebook_name}: {e}"
+                        _write_error(report, error_msg)
+                        errors.append(error_msg)
+
+            if report:
+                _write_report(report)
 
     # Summary
     print(f"\n{'=' * 50}")
@@ -175,7 +205,90 @@ def main(argv: list[str] | None = None) -> int:
     return 0
 
 
-def _deduplicate_sections(files: list[Path]) -> list[Path]:
+def _write_report(lines: list[str]) -> None:
+    """Write buffered progress lines to stdout in a single call."""
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
+    sys.stdout.flush()
+
+
+def _write_error(report: list[str], message: str) -> None:
+    """Print *message* to stderr after flushing the pending progress lines.
+
+    Keeps each error right after the section line it belongs to.
+    """
+    _write_report(report)
+    report.clear()
+    print(message, file=sys.stderr)
+
+
+def _positive_int(value: str) -> int:
+    """Argparse type for options that require an integer >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _init_worker(log_level: int) -> None:
+    """Configure logging in a parser worker process.
+
+    Spawned workers (the default on macOS and Windows) start without the
+    main process's logging setup.
+    """
+    logging.basicConfig(level=log_level, format=_LOG_FORMAT)
+
+
+def _parse_section(section_file: Path) -> Section:
+    """Parse a single .one file into a Section model.
+
+    Runs in a worker process, so it must stay a picklable module-level
+    function.
+    """
+    logging.debug("Parsing %s", section_file)
+    parsed = OneStoreParser(section_file).parse()
+    return extract_section(parsed)
+
+
+def _parse_sections(
+    section_files: list[Path], jobs: int, log_level: int = logging.WARNING
+) -> Iterator[Callable[[], Section]]:
+    """Yield a loader for each of *section_files*, in order.
+
+    Calling a loader returns the parsed Section or raises its parse
+    error.  With one job (or one file) each loader parses its file in
+    the calling process when called, so each notebook is parsed just
+    before it is written.  Otherwise the files are parsed by a worker
+    pool and each loader waits for its file's result.  At most
+    ``2 * workers`` files are queued or held ahead of the caller, so
+    memory grows with *jobs* rather than with the whole input.  Workers
+    log at *log_level*, as the main process does.
+    """
+    workers = min(jobs, len(section_files))
+    if workers <= 1:
+        for section_file in section_files:
+            yield functools.partial(_parse_section, section_file)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(log_level,)
+    ) as pool:
+        remaining = iter(section_files)
+        pending = deque(
+            pool.submit(_parse_section, f)
+            for f in itertools.islice(remaining, 2 * workers)
+        )
+        while pending:
+            future = pending.popleft()
+            # Keep the window full while the caller handles this result.
+            for section_file in itertools.islice(remaining, 1):
+                pending.append(pool.submit(_parse_section, section_file))
+            yield future.result
+
+
+def _deduplicate_sections(files: list[Path]) -> list[tuple[Path, str]]:
     """Keep only the latest version of each section.
 
     Files follow patterns like:
@@ -183,34 +296,22 @@ def _deduplicate_sections(files: list[Path]) -> list[Path]:
       'ADI.one (On 10-3-22).one'  -> section 'ADI', date 2022-10-03
 
     Groups by section name and keeps the file with the latest date.
+    Returns ``(path, section_name)`` pairs so callers don't need to
+    re-derive the name from the filename.
     """
-    date_pattern = re.compile(r"\(On\s+(\d+)-(\d+)-(\d+)(?:\s*-\s*\d+)?\)")
-
     section_versions: dict[str, list[tuple[Path, tuple[int, int, int]]]] = {}
 
     for f in files:
         section_name = section_name_from_filename(f.name)
-        match = date_pattern.search(f.name)
-        if match:
-            month, day, year = (
-                int(match.group(1)),
-                int(match.group(2)),
-                int(match.group(3)),
-            )
-            # Normalize 2-digit year
-            if year < 100:
-                year += 2000 if year < 50 else 1900
-            section_versions.setdefault(section_name, []).append(
-                (f, (year, month, day))
-            )
-        else:
-            section_versions.setdefault(section_name, []).append((f, (0, 0, 0)))
+        section_versions.setdefault(section_name, []).append(
+            (f, section_date_from_filename(f.name))
+        )
 
-    result: list[Path] = []
+    result: list[tuple[Path, str]] = []
     for section_name, versions in sorted(section_versions.items()):
         versions.sort(key=lambda x: x[1], reverse=True)
         latest = versions[0][0]
-        result.append(latest)
+        result.append((latest, section_name))
         if len(versions) > 1:
             skipped = [v[0].name for v in versions[1:]]
             logging.info(
@@ -3,17 +3,36 @@
 Subclasses implement render_page() to produce format-specific content.
 """
 
+import functools
+import hashlib
 import logging
+import os
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from onenote_export.model.content import EmbeddedFile, ImageElement
 from onenote_export.model.notebook import Notebook
 from onenote_export.model.page import Page
 from onenote_export.model.section import Section
+from onenote_export.utils import write_file
 
 logger = logging.getLogger(__name__)
 
+# File writes are I/O-bound and release the GIL, so a pool wider than the
+# CPU count still helps.
+_MAX_WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Characters that are invalid in filenames on at least one platform.
+_BAD_FILENAME_CHARS = str.maketrans(
+    dict.fromkeys('<>:"/\\|?*' + "".join(map(chr, range(32))), "_")
+)
+_FILENAME_SPACING_RE = re.compile(r"[_\s]+")
+
+# Longer names are truncated; a hash of the full name keeps them distinct.
+_MAX_FILENAME_LEN = 200
+_NAME_HASH_BYTES = 6
+
 
 class BaseConverter:
     """Abstract base converter for OneNote content.
@@ -34,6 +53,10 @@ class BaseConverter:
         """
         created: list[Path] = []
         notebook_dir = self.output_dir / _sanitize_filename(notebook.name)
+        # Create the notebook directory once so each section only needs a
+        # single mkdir for its own directory.
+        if notebook.sections:
+            notebook_dir.mkdir(parents=True, exist_ok=True)
 
         for section in notebook.sections:
             files = self.convert_section(section, notebook_dir)
@@ -48,29 +71,55 @@ class BaseConverter:
 
         Returns list of created file paths.
         """
-        created: list[Path] = []
         base_dir = parent_dir or self.output_dir
         section_dir = base_dir / _sanitize_filename(section.name)
         section_dir.mkdir(parents=True, exist_ok=True)
 
         seen_titles: dict[str, int] = {}
+        created_dirs: set[Path] = set()
+        # Image and attachment names can repeat within a section (unnamed
+        # images all become "image.<fmt>"), so binaries are collected by
+        # path, the last page winning, and each path is written exactly
+        # once: two writes to one path must never be in flight together.
+        binaries_by_path: dict[Path, bytes] = {}
+        pending: list[Future[Path] | Path] = []
+
+        # Rendering stays on this thread; only the writes go to the pool.
+        with ThreadPoolExecutor(max_workers=_MAX_WRITE_WORKERS) as pool:
+            for page in section.pages:
+                content = self.render_page(page)
+                filename = _page_filename(page.title, seen_titles, self.FILE_EXTENSION)
+                file_path = section_dir / filename
+                pending.append(
+                    pool.submit(_write_file, file_path, content.encode("utf-8"))
+                )
 
-        for page in section.pages:
-            content = self.render_page(page)
-            filename = _page_filename(page.title, seen_titles, self.FILE_EXTENSION)
-            file_path = section_dir / filename
-
-            file_path.write_text(content, encoding="utf-8")
-            created.append(file_path)
-            logger.info("Wrote %s", file_path)
-
-            image_files = self._write_images(page, section_dir)
-            created.extend(image_files)
-
-            embedded_files = self._write_embedded_files(page, section_dir)
-            created.extend(embedded_files)
-
-        return created
+                # Images first, then attachments; each list shares one
+                # directory, created once per section.
+                for binaries in self._collect_binaries(page, section_dir):
+                    if binaries:
+                        binary_dir = binaries[0][0].parent
+                        if binary_dir not in created_dirs:
+                            binary_dir.mkdir(exist_ok=True)
+                            created_dirs.add(binary_dir)
+                    for path, data in binaries:
+                        if path not in binaries_by_path:
+                            pending.append(path)
+                        binaries_by_path[path] = data
+
+            binary_writes = {
+                path: pool.submit(_write_file, path, data)
+                for path, data in binaries_by_path.items()
+            }
+
+            # Results are collected in first-seen order so the returned
+            # list is deterministic; any write error is re-raised here.
+            return [
+                binary_writes[item].result()
+                if isinstance(item, Path)
+                else item.result()
+                for item in pending
+            ]
 
     def render_page(self, page: Page) -> str:
         """Render a single page to the target format.
@@ -79,50 +128,56 @@ class BaseConverter:
         """
         raise NotImplementedError
 
-    def _write_images(self, page: Page, section_dir: Path) -> list[Path]:
-        """Write image data to files."""
-        created: list[Path] = []
+    def _collect_binaries(
+        self, page: Page, section_dir: Path
+    ) -> tuple[list[tuple[Path, bytes]], list[tuple[Path, bytes]]]:
+        """Collect image and attachment data to write for a page.
+
+        Walks the page elements once and returns ``(images, attachments)``
+        as lists of ``(path, data)`` pairs.
+        """
+        images: list[tuple[Path, bytes]] = []
+        attachments: list[tuple[Path, bytes]] = []
         images_dir = section_dir / "images"
-        img_count = 0
+        attachments_dir = section_dir / "attachments"
 
         for element in page.elements:
             if isinstance(element, ImageElement) and element.data:
-                images_dir.mkdir(exist_ok=True)
-                img_count += 1
                 filename = _sanitize_filename(
                     element.filename
-                    or f"image_{img_count:03d}.{element.format or 'bin'}"
+                    or f"image_{len(images) + 1:03d}.{element.format or 'bin'}"
                 )
-                img_path = images_dir / filename
-                img_path.write_bytes(element.data)
-                created.append(img_path)
-                logger.info("Wrote image %s", img_path)
-
-        return created
+                images.append((images_dir / filename, element.data))
+            elif isinstance(element, EmbeddedFile) and element.data:
+                filename = _sanitize_filename(element.filename or "attachment")
+                attachments.append((attachments_dir / filename, element.data))
 
-    def _write_embedded_files(self, page: Page, section_dir: Path) -> list[Path]:
-        """Write embedded file data to files."""
-        created: list[Path] = []
-        attachments_dir = section_dir / "attachments"
+        return images, attachments
 
-        for element in page.elements:
-            if isinstance(element, EmbeddedFile) and element.data:
-                attachments_dir.mkdir(exist_ok=True)
-                filename = _sanitize_filename(element.filename or "attachment")
-                file_path = attachments_dir / filename
-                file_path.write_bytes(element.data)
-                created.append(file_path)
-                logger.info("Wrote attachment %s", file_path)
 
-        return created
+def _write_file(path: Path, data: bytes) -> Path:
+    """Write *data* to *path* and return the path."""
+    write_file(path, data)
+    logger.info("Wrote %s", path)
+    return path
 
 
+@functools.lru_cache(maxsize=8192)
 def _sanitize_filename(name: str) -> str:
-    """Sanitize a string for use as a filename."""
-    sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1f]', "_", name)
-    sanitized = re.sub(r"[_\s]+", " ", sanitized).strip()
-    if len(sanitized) > 200:
-        sanitized = sanitized[:200]
+    """Sanitize a string for use as a filename.
+
+    Names longer than ``_MAX_FILENAME_LEN`` are truncated and end in a short
+    hash of the full name, so long names sharing a prefix do not collide.
+    Memoized: the same image and attachment names recur across pages.
+    """
+    sanitized = name.translate(_BAD_FILENAME_CHARS)
+    sanitized = _FILENAME_SPACING_RE.sub(" ", sanitized).strip()
+    if len(sanitized) > _MAX_FILENAME_LEN:
+        digest = hashlib.blake2b(
+            name.encode("utf-8", "surrogatepass"), digest_size=_NAME_HASH_BYTES
+        ).hexdigest()
+        keep = _MAX_FILENAME_LEN - len(digest) - 1
+        sanitized = f"{sanitized[:keep].rstrip()} {digest}"
     return sanitized or "unnamed"
 
 
@@ -133,11 +188,10 @@ def _page_filename(title: str, seen: dict[str, int], extension: str = ".md") ->
         base = f"{base}{extension}"
 
     key = base.lower()
-    if key in seen:
-        seen[key] += 1
+    count = seen.get(key, 0) + 1
+    seen[key] = count
+    if count > 1:
         stem = base[: -len(extension)]
-        base = f"{stem} ({seen[key]}){extension}"
-    else:
-        seen[key] = 1
+        base = f"{stem} ({count}){extension}"
 
     return base
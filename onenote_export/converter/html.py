@@ -6,9 +6,17 @@ separate files (same as Markdown).
 """
 
 import html
+from collections.abc import Callable
+from pathlib import Path
 
 from onenote_export.converter.base import BaseConverter, _sanitize_filename
 from onenote_export.model.content import (
+    FLAG_BOLD,
+    FLAG_ITALIC,
+    FLAG_STRIKETHROUGH,
+    FLAG_SUBSCRIPT,
+    FLAG_SUPERSCRIPT,
+    FLAG_UNDERLINE,
     ContentElement,
     EmbeddedFile,
     ImageElement,
@@ -43,6 +51,16 @@ class HTMLConverter(BaseConverter):
 
     FILE_EXTENSION = ".html"
 
+    def __init__(self, output_dir: str | Path) -> None:
+        super().__init__(output_dir)
+        # Exact-type lookup replaces an isinstance chain per element.
+        self._renderers: dict[type[ContentElement], Callable[..., str]] = {
+            RichText: self._render_rich_text,
+            ImageElement: self._render_image,
+            TableElement: self._render_table,
+            EmbeddedFile: self._render_embedded_file,
+        }
+
     def render_page(self, page: Page) -> str:
         """Render a single page to a complete HTML document."""
         body_parts: list[str] = []
@@ -53,7 +71,9 @@ class HTMLConverter(BaseConverter):
         ordered_counters: dict[int, int] = {}
 
         for element in page.elements:
-            if isinstance(element, RichText) and element.list_type == "ordered":
+            # Exact type check: content models are never subclassed.
+            list_type = element.list_type if type(element) is RichText else ""
+            if list_type == "ordered":
                 level = element.indent_level
                 if level not in ordered_counters:
                     ordered_counters[level] = 0
@@ -66,7 +86,7 @@ class HTMLConverter(BaseConverter):
                     ordered_number=ordered_counters[level],
                 )
             else:
-                if not (isinstance(element, RichText) and element.list_type):
+                if not list_type:
                     ordered_counters.clear()
                 rendered = self._render_element(element)
 
@@ -99,15 +119,8 @@ class HTMLConverter(BaseConverter):
 
     def _render_element(self, element: ContentElement) -> str:
         """Render a single content element to HTML."""
-        if isinstance(element, RichText):
-            return self._render_rich_text(element)
-        elif isinstance(element, ImageElement):
-            return self._render_image(element)
-        elif isinstance(element, TableElement):
-            return self._render_table(element)
-        elif isinstance(element, EmbeddedFile):
-            return self._render_embedded_file(element)
-        return ""
+        renderer = self._renderers.get(type(element))
+        return renderer(element) if renderer else ""
 
     def _render_rich_text(
         self,
@@ -115,6 +128,35 @@ class HTMLConverter(BaseConverter):
         ordered_number: int = 0,
     ) -> str:
         """Render rich text to HTML."""
+        if rt.is_plain:
+            # Fast path for unformatted paragraphs, the bulk of most notes.
+            inline = html.escape("".join(run.text for run in rt.runs))
+        else:
+            inline = self._render_runs(rt)
+
+        if rt.heading_level:
+            level = min(rt.heading_level, 6)
+            return f"<h{level}>{inline}</h{level}>"
+
+        align_style = ""
+        if rt.alignment and rt.alignment != "left":
+            align_style = f' style="text-align: {html.escape(rt.alignment)}"'
+
+        if rt.list_type:
+            tag = "ol" if rt.list_type == "ordered" else "ul"
+            prefix = f"<{tag}>" + "<li><ul>" * rt.indent_level
+            suffix = "</ul></li>" * rt.indent_level + f"</{tag}>"
+            return f"{prefix}<li>{inline}</li>{suffix}"
+
+        if rt.indent_level > 0:
+            prefix = "<ul>" * rt.indent_level
+            suffix = "</ul>" * rt.indent_level
+            return f"{prefix}<li>{inline}</li>{suffix}"
+
+        return f"<p{align_style}>{inline}</p>"
+
+    def _render_runs(self, rt: RichText) -> str:
+        """Render the formatted text runs of *rt* to inline HTML."""
         parts: list[str] = []
 
         for run in rt.runs:
@@ -128,44 +170,25 @@ class HTMLConverter(BaseConverter):
                 escaped_url = html.escape(run.hyperlink_url, quote=True)
                 text = f'<a href="{escaped_url}">{text}</a>'
 
-            if not rt.heading_level:
-                if run.bold:
+            # Headings carry their own emphasis; ignore run formatting.
+            flags = 0 if rt.heading_level else run.flags
+            if flags:
+                if flags & FLAG_BOLD:
                     text = f"<strong>{text}</strong>"
-                if run.italic:
+                if flags & FLAG_ITALIC:
                     text = f"<em>{text}</em>"
-                if run.underline and not run.hyperlink_url:
+                if flags & FLAG_UNDERLINE and not run.hyperlink_url:
                     text = f"<u>{text}</u>"
-                if run.strikethrough:
+                if flags & FLAG_STRIKETHROUGH:
                     text = f"<del>{text}</del>"
-                if run.superscript:
+                if flags & FLAG_SUPERSCRIPT:
                     text = f"<sup>{text}</sup>"
-                if run.subscript:
+                if flags & FLAG_SUBSCRIPT:
                     text = f"<sub>{text}</sub>"
 
             parts.append(text)
 
-        inline = "".join(parts)
-
-        if rt.heading_level:
-            level = min(rt.heading_level, 6)
-            return f"<h{level}>{inline}</h{level}>"
-
-        align_style = ""
-        if rt.alignment and rt.alignment != "left":
-            align_style = f' style="text-align: {html.escape(rt.alignment)}"'
-
-        if rt.list_type:
-            tag = "ol" if rt.list_type == "ordered" else "ul"
-            prefix = f"<{tag}>" + "<li><ul>" * rt.indent_level
-            suffix = "</ul></li>" * rt.indent_level + f"</{tag}>"
-            return f"{prefix}<li>{inline}</li>{suffix}"
-
-        if rt.indent_level > 0:
-            prefix = "<ul>" * rt.indent_level
-            suffix = "</ul>" * rt.indent_level
-            return f"{prefix}<li>{inline}</li>{suffix}"
-
-        return f"<p{align_style}>{inline}</p>"
+        return "".join(parts)
 
     def _render_image(self, img: ImageElement) -> str:
         """Render image reference in HTML."""
@@ -190,11 +213,12 @@ class HTMLConverter(BaseConverter):
             lines.append("<tr>")
             cell_tag = "th" if i == 0 else "td"
             for cell_elements in row:
-                cell_html = " ".join(
-                    self._render_element(e)
-                    for e in cell_elements
-                    if self._render_element(e)
-                )
+                parts: list[str] = []
+                for e in cell_elements:
+                    rendered = self._render_element(e)
+                    if rendered:
+                        parts.append(rendered)
+                cell_html = " ".join(parts)
                 lines.append(f"<{cell_tag}>{cell_html}</{cell_tag}>")
             lines.append("</tr>")
 
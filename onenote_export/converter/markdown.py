@@ -4,8 +4,18 @@ Converts Page objects with ContentElements into Markdown text.
 File I/O is handled by the BaseConverter superclass.
 """
 
+import io
+from collections.abc import Callable
+from pathlib import Path
+
 from onenote_export.converter.base import BaseConverter, _sanitize_filename
 from onenote_export.model.content import (
+    FLAG_BOLD,
+    FLAG_ITALIC,
+    FLAG_STRIKETHROUGH,
+    FLAG_SUBSCRIPT,
+    FLAG_SUPERSCRIPT,
+    FLAG_UNDERLINE,
     ContentElement,
     EmbeddedFile,
     ImageElement,
@@ -14,24 +24,86 @@ from onenote_export.model.content import (
 )
 from onenote_export.model.page import Page
 
+_BOLD_ITALIC = FLAG_BOLD | FLAG_ITALIC
+_SCRIPT_FLAGS = FLAG_SUPERSCRIPT | FLAG_SUBSCRIPT
+
+
+def _build_wrappers() -> tuple[tuple[str, str], ...]:
+    """Precompute the ``(prefix, suffix)`` Markdown wrapper for every flag set.
+
+    Strikethrough sits innermost, then bold/italic, underline, superscript
+    and subscript.
+    """
+    wrappers = []
+    for flags in range(FLAG_SUBSCRIPT << 1):
+        prefix = suffix = ""
+        if flags & FLAG_STRIKETHROUGH:
+            prefix, suffix = "~~", "~~"
+        emphasis = flags & _BOLD_ITALIC
+        if emphasis == _BOLD_ITALIC:
+            mark = "***"
+        elif emphasis == FLAG_BOLD:
+            mark = "**"
+        else:
+            mark = "*" if emphasis else ""
+        if flags & FLAG_UNDERLINE:
+            mark = f"*{mark}"
+        prefix, suffix = f"{mark}{prefix}", f"{suffix}{mark}"
+        if flags & FLAG_SUPERSCRIPT:
+            prefix, suffix = f"<sup>{prefix}", f"{suffix}</sup>"
+        if flags & FLAG_SUBSCRIPT:
+            prefix, suffix = f"<sub>{prefix}", f"{suffix}</sub>"
+        wrappers.append((prefix, suffix))
+    return tuple(wrappers)
+
+
+# Indexed by TextRun.flags.
+_WRAPPERS = _build_wrappers()
+
 
 class MarkdownConverter(BaseConverter):
     """Converts OneNote content model to Markdown files."""
 
     FILE_EXTENSION = ".md"
 
+    def __init__(self, output_dir: str | Path) -> None:
+        super().__init__(output_dir)
+        # Exact-type lookup replaces an isinstance chain per element.
+        self._renderers: dict[type[ContentElement], Callable[..., str]] = {
+            RichText: self._render_rich_text,
+            ImageElement: self._render_image,
+            TableElement: self._render_table,
+            EmbeddedFile: self._render_embedded_file,
+        }
+
     def render_page(self, page: Page) -> str:
-        """Render a single page to Markdown text."""
-        lines: list[str] = []
+        """Render a single page to Markdown text.
+
+        Blocks are streamed into a single buffer, separated by a blank
+        line, rather than collected into a list and joined.
+        """
+        if not (page.title or page.elements or page.author):
+            return ""
+
+        buf = io.StringIO()
+        separator = ""
+
+        def emit(block: str) -> None:
+            nonlocal separator
+            buf.write(separator)
+            buf.write(block)
+            buf.write("\n")
+            separator = "\n"
 
         if page.title:
-            lines.append(f"# {page.title}")
-            lines.append("")
+            emit(f"# {page.title}")
 
         ordered_counters: dict[int, int] = {}
 
         for element in page.elements:
-            if isinstance(element, RichText) and element.list_type == "ordered":
+            # Exact type check: content models are never subclassed.
+            list_type = element.list_type if type(element) is RichText else ""
+            if list_type == "ordered":
                 level = element.indent_level
                 if level not in ordered_counters:
                     ordered_counters[level] = 0
@@ -44,32 +116,22 @@ class MarkdownConverter(BaseConverter):
                     ordered_number=ordered_counters[level],
                 )
             else:
-                if not (isinstance(element, RichText) and element.list_type):
+                if not list_type:
                     ordered_counters.clear()
                 md = self._render_element(element)
 
             if md:
-                lines.append(md)
-                lines.append("")
+                emit(md)
 
         if page.author:
-            lines.append("---")
-            lines.append(f"*Author: {page.author}*")
-            lines.append("")
+            emit(f"---\n*Author: {page.author}*")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _render_element(self, element: ContentElement) -> str:
         """Render a single content element to Markdown."""
-        if isinstance(element, RichText):
-            return self._render_rich_text(element)
-        elif isinstance(element, ImageElement):
-            return self._render_image(element)
-        elif isinstance(element, TableElement):
-            return self._render_table(element)
-        elif isinstance(element, EmbeddedFile):
-            return self._render_embedded_file(element)
-        return ""
+        renderer = self._renderers.get(type(element))
+        return renderer(element) if renderer else ""
 
     def _render_rich_text(
         self,
@@ -77,37 +139,11 @@ class MarkdownConverter(BaseConverter):
         ordered_number: int = 0,
     ) -> str:
         """Render rich text to Markdown."""
-        parts: list[str] = []
-
-        for run in rt.runs:
-            text = run.text
-            if not text:
-                continue
-
-            if not rt.heading_level:
-                if run.strikethrough:
-                    text = f"~~{text}~~"
-                if run.bold and run.italic:
-                    text = f"***{text}***"
-                elif run.bold:
-                    text = f"**{text}**"
-                elif run.italic:
-                    text = f"*{text}*"
-                if run.underline and not run.hyperlink_url:
-                    text = f"*{text}*"
-
-            if run.hyperlink_url:
-                text = f"[{run.text}]({run.hyperlink_url})"
-
-            if not rt.heading_level:
-                if run.superscript:
-                    text = f"<sup>{text}</sup>"
-                if run.subscript:
-                    text = f"<sub>{text}</sub>"
-
-            parts.append(text)
-
-        result = "".join(parts)
+        if rt.is_plain:
+            # Fast path for unformatted paragraphs, the bulk of most notes.
+            result = "".join(run.text for run in rt.runs)
+        else:
+            result = self._render_runs(rt)
 
         if rt.heading_level:
             prefix = "#" * rt.heading_level
@@ -126,6 +162,30 @@ class MarkdownConverter(BaseConverter):
 
         return result
 
+    def _render_runs(self, rt: RichText) -> str:
+        """Render the formatted text runs of *rt* to inline Markdown."""
+        parts: list[str] = []
+
+        for run in rt.runs:
+            text = run.text
+            if not text:
+                continue
+
+            # Headings carry their own emphasis; ignore run formatting.
+            flags = 0 if rt.heading_level else run.flags
+
+            if run.hyperlink_url:
+                # Links drop the inline emphasis; only sub/superscript wrap.
+                text = f"[{text}]({run.hyperlink_url})"
+                flags &= _SCRIPT_FLAGS
+            if flags:
+                prefix, suffix = _WRAPPERS[flags]
+                text = f"{prefix}{text}{suffix}"
+
+            parts.append(text)
+
+        return "".join(parts)
+
     def _render_image(self, img: ImageElement) -> str:
         """Render image reference in Markdown."""
         alt = img.alt_text or img.filename or "image"
@@ -141,25 +201,19 @@ class MarkdownConverter(BaseConverter):
         if not table.rows:
             return ""
 
-        lines: list[str] = []
-
-        for i, row in enumerate(table.rows):
-            cells = []
-            for cell_elements in row:
-                cell_text = " ".join(
-                    self._render_element(e).strip()
-                    for e in cell_elements
-                    if self._render_element(e).strip()
-                )
-                cells.append(cell_text or " ")
-
-            lines.append("| " + " | ".join(cells) + " |")
-
-            if i == 0:
-                lines.append("| " + " | ".join("---" for _ in cells) + " |")
-
+        lines = [
+            "| " + " | ".join([self._render_cell(cell) for cell in row]) + " |"
+            for row in table.rows
+        ]
+        separator = "| " + " | ".join(["---"] * len(table.rows[0])) + " |"
+        lines.insert(1, separator)
         return "\n".join(lines)
 
+    def _render_cell(self, cell_elements: list[ContentElement]) -> str:
+        """Render the elements of one table cell, blank cells as a space."""
+        rendered = (self._render_element(e).strip() for e in cell_elements)
+        return " ".join([text for text in rendered if text]) or " "
+
     def _render_embedded_file(self, ef: EmbeddedFile) -> str:
         """Render embedded file reference in Markdown."""
         name = ef.filename or "attachment"
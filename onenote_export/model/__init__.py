@@ -1,6 +1,12 @@
 """Content model for OneNote documents."""
 
 from onenote_export.model.content import (
+    FLAG_BOLD,
+    FLAG_ITALIC,
+    FLAG_STRIKETHROUGH,
+    FLAG_SUBSCRIPT,
+    FLAG_SUPERSCRIPT,
+    FLAG_UNDERLINE,
     ContentElement,
     EmbeddedFile,
     ImageElement,
@@ -13,6 +19,12 @@ from onenote_export.model.page import Page
 from onenote_export.model.section import Section
 
 __all__ = [
+    "FLAG_BOLD",
+    "FLAG_ITALIC",
+    "FLAG_STRIKETHROUGH",
+    "FLAG_SUBSCRIPT",
+    "FLAG_SUPERSCRIPT",
+    "FLAG_UNDERLINE",
     "ContentElement",
     "EmbeddedFile",
     "ImageElement",
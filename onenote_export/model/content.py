@@ -2,10 +2,22 @@
 
 from dataclasses import dataclass, field
 
+# TextRun formatting flags, packed into ``TextRun.flags``.
+FLAG_BOLD = 1 << 0
+FLAG_ITALIC = 1 << 1
+FLAG_UNDERLINE = 1 << 2
+FLAG_STRIKETHROUGH = 1 << 3
+FLAG_SUPERSCRIPT = 1 << 4
+FLAG_SUBSCRIPT = 1 << 5
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TextRun:
-    """A run of text with uniform formatting."""
+    """A run of text with uniform formatting.
+
+    ``flags`` is derived from the boolean formatting fields so renderers
+    can test all of them with a single integer.
+    """
 
     text: str
     bold: bool = False
@@ -17,16 +29,29 @@ class TextRun:
     font: str = ""
     font_size: int = 0
     hyperlink_url: str = ""
-
-
-@dataclass
+    flags: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "flags",
+            (FLAG_BOLD if self.bold else 0)
+            | (FLAG_ITALIC if self.italic else 0)
+            | (FLAG_UNDERLINE if self.underline else 0)
+            | (FLAG_STRIKETHROUGH if self.strikethrough else 0)
+            | (FLAG_SUPERSCRIPT if self.superscript else 0)
+            | (FLAG_SUBSCRIPT if self.subscript else 0),
+        )
+
+
+@dataclass(slots=True)
 class ContentElement:
     """Base class for content elements."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class RichText(ContentElement):
     """A rich text element containing formatted text runs."""
 
@@ -37,8 +62,18 @@ class RichText(ContentElement):
     heading_level: int = 0  # 1-6 for headings, 0 for normal text
     list_type: str = ""  # "ordered", "unordered", "" for non-list
 
+    @property
+    def is_plain(self) -> bool:
+        """True if this renders as the bare concatenation of its runs.
+
+        Headings ignore run formatting, so only hyperlinks matter there.
+        """
+        if self.heading_level:
+            return not any(run.hyperlink_url for run in self.runs)
+        return not any(run.flags or run.hyperlink_url for run in self.runs)
+
 
-@dataclass
+@dataclass(slots=True)
 class ImageElement(ContentElement):
     """An image embedded in the page."""
 
@@ -50,7 +85,7 @@ class ImageElement(ContentElement):
     format: str = ""  # "png", "jpeg", "gif", "bmp"
 
 
-@dataclass
+@dataclass(slots=True)
 class TableElement(ContentElement):
     """A table with rows and cells."""
 
@@ -59,7 +94,7 @@ class TableElement(ContentElement):
     borders_visible: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class EmbeddedFile(ContentElement):
     """An embedded file attachment."""
 
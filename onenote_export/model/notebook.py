@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from onenote_export.model.section import Section
 
 
-@dataclass
+@dataclass(slots=True)
 class Notebook:
     """A notebook (corresponds to a directory) containing sections."""
 
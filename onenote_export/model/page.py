@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from onenote_export.model.content import ContentElement
 
 
-@dataclass
+@dataclass(slots=True)
 class Page:
     """A single page in a OneNote section."""
 
@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from onenote_export.model.page import Page
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """A section (corresponds to a single .one file) containing pages."""
 
@@ -2,13 +2,16 @@
 
 Bridges the parser output (ExtractedSection) to the high-level
 content model (Section with Pages and ContentElements).
+
+``ExtractedObject.obj_type`` values are interned by the parser, so the
+type checks against the string constants below compare by identity.
+``ExtractedObject`` normalizes ``ElementChildNodesOfVersionHistory`` to a
+list of strings, so it is iterated here without type checks.
 """
 
-import ast
 import logging
 import re
 from dataclasses import dataclass
-from pathlib import Path
 
 from onenote_export.model.content import (
     ContentElement,
@@ -25,6 +28,12 @@ from onenote_export.parser.one_store import (
     ExtractedPage,
     ExtractedSection,
 )
+from onenote_export.utils import (
+    U16,
+    bytes_from_repr,
+    parse_int_prop,
+    section_name_from_filename,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +51,12 @@ _STYLE_CONTAINER = "jcidPersistablePropertyContainerForTOCSection"
 
 # Structural types that delimit content groups in the flat object list.
 _STRUCTURAL_TYPES = frozenset({_OUTLINE_ELEMENT, _OUTLINE_NODE})
+# Content-bearing types (the ones that can be duplicated or orphaned).
+_CONTENT_TYPES = frozenset({_RICH_TEXT, _IMAGE_NODE, _EMBEDDED_FILE})
+# Types making up an outline group: an OE followed by its content.
+_OUTLINE_GROUP_TYPES = _CONTENT_TYPES | {_OUTLINE_ELEMENT}
+# Types that end a table cell's inline content.
+_CELL_BOUNDARY_TYPES = frozenset({_TABLE_CELL, _TABLE_ROW})
 
 # ParagraphStyleId → heading level mapping
 _HEADING_STYLE_MAP: dict[str, int] = {
@@ -60,10 +75,13 @@ _HEADING_STYLE_MAP: dict[str, int] = {
 _HYPERLINK_FIELD_RE = re.compile(
     r"[\uFDDF\uFDF3]HYPERLINK\s+\"([^\"]+)\"([^\uFDDF\uFDF3]+)",
 )
+# Either field code marker; lets text be checked in a single scan.
+_FIELD_MARKER_RE = re.compile("[\uFDDF\uFDF3]")
 
 
 def _deduplicate_objects(
     objects: list[ExtractedObject],
+    text_cache: dict[int, str] | None = None,
 ) -> list[ExtractedObject]:
     """Remove duplicate content objects caused by OneNote revision history.
 
@@ -74,49 +92,39 @@ def _deduplicate_objects(
     The detection finds the first content fingerprint that appears
     more than once.  If no duplicate is found, the objects are
     returned unchanged (no revision copies present).
+
+    If *text_cache* is given, the text decoded for each rich-text
+    fingerprint is stored in it, keyed by ``id(obj)``, so that
+    extraction does not have to decode it again.
     """
     if len(objects) < 4:
         return objects
 
-    # Build a fingerprint sequence for content-bearing objects
-    fingerprints: list[str] = []
-    for obj in objects:
-        fp = _object_fingerprint(obj)
-        fingerprints.append(fp)
+    # Build a fingerprint sequence; only content-bearing objects
+    # (_CONTENT_TYPES) get a fingerprint, everything else is None.
+    fingerprints = [_object_fingerprint(obj, text_cache) for obj in objects]
 
     # Find the repeat pattern: look for the first content fingerprint
-    # appearing again later in the sequence
-    content_fps = [
-        (i, fp)
-        for i, fp in enumerate(fingerprints)
-        if fp and objects[i].obj_type in (_RICH_TEXT, _IMAGE_NODE, _EMBEDDED_FILE)
-    ]
-
-    if len(content_fps) < 2:
+    # appearing again later in the sequence.  The scan for the repeat is
+    # list.index, which compares in C rather than in a Python loop.
+    first_idx = next(
+        (i for i, fp in enumerate(fingerprints) if fp is not None), None
+    )
+    if first_idx is None:
         return objects
-
-    # Find where the first content element repeats
-    first_fp = content_fps[0][1]
-    repeat_idx = None
-
-    for i, fp in content_fps[1:]:
-        if fp == first_fp:
-            repeat_idx = i
-            break
-
-    if repeat_idx is None:
+    try:
+        fingerprints.index(fingerprints[first_idx], first_idx + 1)
+    except ValueError:
         return objects
 
     # Take objects up to the repeat point, plus any non-content objects
     # (styles, outline elements) that follow
     result: list[ExtractedObject] = []
-    seen_content: set[str] = set()
-
-    for i, obj in enumerate(objects):
-        fp = fingerprints[i]
+    seen_content: set[tuple[str, ...]] = set()
 
+    for obj, fp in zip(objects, fingerprints):
         # Non-content objects (styles, outlines) - always include
-        if not fp:
+        if fp is None:
             result.append(obj)
             continue
 
@@ -128,31 +136,32 @@ def _deduplicate_objects(
     return result
 
 
-def _object_fingerprint(obj: ExtractedObject) -> str:
+def _object_fingerprint(
+    obj: ExtractedObject,
+    text_cache: dict[int, str] | None = None,
+) -> tuple[str, ...] | None:
     """Create a content-based fingerprint for deduplication.
 
     Normalises text by decoding from both Unicode and ASCII property
     fields so that different encoding representations of the same
-    content produce the same fingerprint.
+    content produce the same fingerprint.  The fingerprint is a tuple
+    tagged with the object type, so the decoded text is hashed once
+    rather than copied into a new prefixed string.  Objects without
+    identifying content return None.
     """
     if obj.obj_type == _RICH_TEXT:
-        raw_unicode = obj.properties.get("RichEditTextUnicode", "")
-        raw_ascii = obj.properties.get("TextExtendedAscii", "")
-        if raw_unicode:
-            decoded = _decode_text_value(raw_unicode, encoding="unicode")
-        elif raw_ascii:
-            decoded = _decode_text_value(raw_ascii, encoding="ascii")
-        else:
-            decoded = ""
-        return f"text:{decoded}" if decoded.strip() else ""
+        decoded = _decode_rich_text(obj.properties)
+        if text_cache is not None:
+            text_cache[id(obj)] = decoded
+        return (_RICH_TEXT, decoded) if decoded.strip() else None
     elif obj.obj_type == _IMAGE_NODE:
         filename = str(obj.properties.get("ImageFilename", ""))
         alt = str(obj.properties.get("ImageAltText", ""))
-        return f"img:{filename}:{alt}" if (filename or alt) else ""
+        return (_IMAGE_NODE, filename, alt) if (filename or alt) else None
     elif obj.obj_type == _EMBEDDED_FILE:
         name = str(obj.properties.get("EmbeddedFileName", ""))
-        return f"file:{name}" if name else ""
-    return ""
+        return (_EMBEDDED_FILE, name) if name else None
+    return None
 
 
 def _reorder_by_outline_hierarchy(
@@ -181,60 +190,58 @@ def _reorder_by_outline_hierarchy(
     if len(objects) < 4:
         return objects
 
-    has_outline = any(obj.obj_type == _OUTLINE_NODE for obj in objects)
-    if not has_outline:
-        return objects
-
-    # Collect orphaned content: content objects before the first structural element.
-    orphans: tuple[ExtractedObject, ...] = ()
-    pre: list[ExtractedObject] = []
+    # Collect orphaned content: content objects before the first structural
+    # element.  This prefix scan is cheap and settles most pages.
+    orphans: list[ExtractedObject] = []
     for obj in objects:
         if obj.obj_type in _STRUCTURAL_TYPES:
             break
-        if obj.obj_type in (_RICH_TEXT, _IMAGE_NODE, _EMBEDDED_FILE):
-            pre.append(obj)
-    orphans = tuple(pre)
+        if obj.obj_type in _CONTENT_TYPES:
+            orphans.append(obj)
 
     # If no orphaned content, objects are already in usable order.
     if not orphans:
         return objects
 
-    # Build identity → object lookup
+    # Single sweep building the identity lookup, each OE's inline content
+    # range (the non-structural objects following it, as a half-open index
+    # range into ``objects``), the set of wrapper OEs, and the outline nodes.
+    #
+    # Leaf OEs (no child OEs) are the only ones eligible for orphan
+    # matching; wrapper OEs (those with ElementChildNodesOfVersionHistory)
+    # are structural and should not receive orphaned content.
     id_to_obj: dict[str, ExtractedObject] = {}
-    for obj in objects:
-        if obj.identity:
-            id_to_obj[obj.identity] = obj
+    oe_ranges: dict[str, tuple[int, int]] = {}
+    oes_with_children: set[str] = set()
+    outline_nodes: list[tuple[int, ExtractedObject]] = []
+    current_oe: str | None = None
+    group_start = 0
 
-    # Build OE → content group (non-structural objects following the OE).
-    oe_content: dict[str, list[ExtractedObject]] = {}
     for i, obj in enumerate(objects):
-        if obj.obj_type != _OUTLINE_ELEMENT:
-            continue
-        group: list[ExtractedObject] = []
-        j = i + 1
-        while j < len(objects):
-            nxt = objects[j]
-            if nxt.obj_type in _STRUCTURAL_TYPES:
-                break
-            group.append(nxt)
-            j += 1
-        oe_content[obj.identity] = group
-
-    # Identify leaf OEs: OEs that have no child OEs themselves.
-    # Only leaf OEs are eligible for orphan matching; wrapper OEs
-    # (those with ElementChildNodesOfVersionHistory) are structural
-    # and should not receive orphaned content.
-    oes_with_children: set[str] = set()
-    for obj in objects:
-        if obj.obj_type != _OUTLINE_ELEMENT:
+        if obj.identity:
+            id_to_obj[obj.identity] = obj
+        if obj.obj_type not in _STRUCTURAL_TYPES:
             continue
-        refs = obj.properties.get("ElementChildNodesOfVersionHistory", [])
-        if refs:
-            oes_with_children.add(obj.identity)
+        if current_oe is not None:
+            oe_ranges[current_oe] = (group_start, i)
+            current_oe = None
+        if obj.obj_type == _OUTLINE_ELEMENT:
+            current_oe = obj.identity
+            group_start = i + 1
+            if obj.properties.get("ElementChildNodesOfVersionHistory", []):
+                oes_with_children.add(obj.identity)
+        else:
+            outline_nodes.append((i, obj))
+
+    if current_oe is not None:
+        oe_ranges[current_oe] = (group_start, len(objects))
+
+    if not outline_nodes:
+        return objects
 
     visited: set[str] = set()
     result: list[ExtractedObject] = []
-    orphan_idx = 0  # index into the immutable orphans tuple
+    orphan_idx = 0  # index of the next unassigned orphan
 
     def _emit(obj: ExtractedObject) -> None:
         ident = obj.identity
@@ -244,48 +251,43 @@ def _reorder_by_outline_hierarchy(
             visited.add(ident)
         result.append(obj)
 
-    def _walk_oe(oe_id: str) -> None:
+    def _walk_oes(root: ExtractedObject) -> None:
+        """Emit the OEs below *root* depth-first, in pre-order.
+
+        Uses an explicit stack rather than recursion, so deeply nested
+        outlines neither pay a call per OE nor hit the recursion limit.
+        """
         nonlocal orphan_idx
-        if oe_id in visited:
-            return
-        oe_obj = id_to_obj.get(oe_id)
-        if oe_obj is None:
-            return
+        stack = _child_ids(root)
+        stack.reverse()
+        while stack:
+            oe_id = stack.pop()
+            if oe_id in visited:
+                continue
+            oe_obj = id_to_obj.get(oe_id)
+            if oe_obj is None:
+                continue
 
-        _emit(oe_obj)
-
-        group = oe_content.get(oe_id, [])
-        if group:
-            for g in group:
-                _emit(g)
-        elif (
-            orphan_idx < len(orphans)
-            and oe_id not in oes_with_children
-        ):
-            # Contentless leaf OE — assign next orphan.
-            _emit(orphans[orphan_idx])
-            orphan_idx += 1
-
-        child_refs = oe_obj.properties.get(
-            "ElementChildNodesOfVersionHistory", []
-        )
-        if isinstance(child_refs, str):
-            child_refs = [child_refs]
-        if isinstance(child_refs, list):
-            for ref in child_refs:
-                if isinstance(ref, str):
-                    _walk_oe(ref)
+            _emit(oe_obj)
+
+            group_start, group_end = oe_ranges.get(oe_id, (0, 0))
+            if group_start < group_end:
+                for k in range(group_start, group_end):
+                    _emit(objects[k])
+            elif orphan_idx < len(orphans) and oe_id not in oes_with_children:
+                # Contentless leaf OE — assign next orphan.
+                _emit(orphans[orphan_idx])
+                orphan_idx += 1
+
+            # Push children reversed so the first child is visited next.
+            children = _child_ids(oe_obj)
+            children.reverse()
+            stack.extend(children)
 
     # Process outline nodes sorted by vertical position.
     # Nodes without OffsetFromParentVert (title/date blocks) come first,
     # ordered by original index.  Nodes with a vert value follow, sorted
     # ascending (top-to-bottom on the page).
-    outline_nodes = [
-        (i, obj)
-        for i, obj in enumerate(objects)
-        if obj.obj_type == _OUTLINE_NODE
-    ]
-
     def _node_sort_key(
         item: tuple[int, ExtractedObject],
     ) -> tuple[int, int]:
@@ -293,21 +295,13 @@ def _reorder_by_outline_hierarchy(
         vert = node.properties.get("OffsetFromParentVert")
         if vert is None:
             return (0, idx)
-        return (1, _parse_int_prop(vert))
+        return (1, parse_int_prop(vert))
 
     outline_nodes.sort(key=_node_sort_key)
 
     for _, node in outline_nodes:
         _emit(node)
-        child_refs = node.properties.get(
-            "ElementChildNodesOfVersionHistory", []
-        )
-        if isinstance(child_refs, str):
-            child_refs = [child_refs]
-        if isinstance(child_refs, list):
-            for ref in child_refs:
-                if isinstance(ref, str):
-                    _walk_oe(ref)
+        _walk_oes(node)
 
     # Append remaining unvisited objects in original order.
     for obj in objects:
@@ -316,89 +310,62 @@ def _reorder_by_outline_hierarchy(
     return result
 
 
+def _child_ids(obj: ExtractedObject) -> list[str]:
+    """Return the child identities listed in ElementChildNodesOfVersionHistory.
+
+    ExtractedObject normalizes the property to a list of strings.  Always
+    returns a new list.
+    """
+    return list(obj.properties.get("ElementChildNodesOfVersionHistory", []))
+
+
 def extract_section(parsed: ExtractedSection) -> Section:
     """Convert an ExtractedSection into a high-level Section model."""
     section = Section(
-        name=parsed.display_name or _section_name_from_path(parsed.file_path),
+        name=parsed.display_name or section_name_from_filename(parsed.file_path),
         file_path=parsed.file_path,
     )
 
+    # Resolve paragraph styles to heading levels once for the section.
+    heading_levels = _heading_levels(parsed.paragraph_styles)
+
     for extracted_page in parsed.pages:
         page = _build_page(
             extracted_page,
             parsed.file_data,
-            parsed.paragraph_styles,
+            heading_levels,
         )
         section.pages.append(page)
 
     return section
 
 
-def _find_out_of_line_table_refs(objects: list[ExtractedObject]) -> set[int]:
-    """Find objects that are referenced as out-of-line table cell content.
-
-    When a cell is recently edited, OneNote may store its content under a
-    new revision GUID that lands earlier in the flat object list.  The
-    cell's ``ElementChildNodesOfVersionHistory`` references that GUID.
-
-    This pre-scan identifies those referenced objects so the main loop
-    can skip them (they will be pulled in by ``_extract_table`` instead).
-    """
-    _TABLE_CELL_TYPE = "jcidTableCellNode"
-
-    # Build identity → index map
-    identity_map: dict[str, int] = {}
-    for idx, obj in enumerate(objects):
-        if obj.identity:
-            identity_map[obj.identity] = idx
-
-    # Collect all cell child-ref GUIDs and the index range of inline
-    # content that immediately follows each cell.
-    inline_ranges: set[int] = set()
-    cell_refs: list[str] = []
-
-    for idx, obj in enumerate(objects):
-        if obj.obj_type != _TABLE_CELL_TYPE:
-            continue
-        refs = obj.properties.get("ElementChildNodesOfVersionHistory", [])
-        if isinstance(refs, list):
-            cell_refs.extend(refs)
-        # Mark the inline content region (objects right after the cell)
-        j = idx + 1
-        while j < len(objects):
-            inner = objects[j]
-            if inner.obj_type in (
-                _TABLE_CELL_TYPE,
-                "jcidTableRowNode",
-                "jcidTableNode",
-            ):
-                break
-            inline_ranges.add(j)
-            j += 1
-
-    # For each ref, if its target is OUTSIDE the inline table region,
-    # it's out-of-line content that should be skipped in the main loop.
-    out_of_line: set[int] = set()
-    for ref in cell_refs:
-        ref_idx = identity_map.get(ref)
-        if ref_idx is None or ref_idx in inline_ranges:
-            continue
-        # Walk forward from the ref, collecting the outline group
-        j = ref_idx
-        while j < len(objects):
-            robj = objects[j]
-            if robj.obj_type in (
-                "jcidOutlineElementNode",
-                "jcidRichTextOENode",
-                "jcidImageNode",
-                "jcidEmbeddedFileNode",
-            ):
-                out_of_line.add(j)
-                j += 1
-            else:
-                break
-
-    return out_of_line
+@dataclass(frozen=True)
+class _TextStyle:
+    """Run formatting from a style container, resolved once per container."""
+
+    bold: bool = False
+    italic: bool = False
+    underline: bool = False
+    strikethrough: bool = False
+    superscript: bool = False
+    subscript: bool = False
+    font: str = ""
+    font_size: int = 0
+
+
+def _text_style(props: dict[str, object]) -> _TextStyle:
+    """Resolve a style container's properties into a _TextStyle."""
+    return _TextStyle(
+        bold=_as_bool(props.get("Bold", False)),
+        italic=_as_bool(props.get("Italic", False)),
+        underline=_as_bool(props.get("Underline", False)),
+        strikethrough=_as_bool(props.get("Strikethrough", False)),
+        superscript=_as_bool(props.get("Superscript", False)),
+        subscript=_as_bool(props.get("Subscript", False)),
+        font=_clean_text(str(props.get("Font", ""))),
+        font_size=parse_int_prop(props.get("FontSize", 0), width=2),
+    )
 
 
 @dataclass(frozen=True)
@@ -421,38 +388,90 @@ _BULLET_MSAA_LEVEL: dict[int, int] = {1: 1, 4: 2, 9: 3}
 _NUMBERED_MSAA_LEVEL: dict[int, int] = {36: 1, 53: 2, 45: 3}
 
 
-def _build_list_node_map(
-    objects: list[ExtractedObject],
-) -> dict[str, dict[str, object]]:
-    """Build a mapping from NumberListNode identity to its properties."""
-    result: dict[str, dict[str, object]] = {}
-    for obj in objects:
-        if obj.obj_type == _NUMBER_LIST:
-            result[obj.identity] = dict(obj.properties)
-    return result
+@dataclass(frozen=True)
+class _PageIndex:
+    """Lookup structures gathered by the single pre-scan of a page."""
+
+    # Object identity → index in the object list (last occurrence wins).
+    identity_map: dict[str, int]
+    # NumberListNode identity → its properties.
+    list_node_map: dict[str, dict[str, object]]
+    # OutlineElement identities that are direct children of OutlineNodes.
+    top_level_oe_ids: set[str]
+    # Indices of out-of-line table cell content.
+    out_of_line: set[int]
+
+
+def _prescan(objects: list[ExtractedObject]) -> _PageIndex:
+    """Collect everything ``_build_page`` needs to know up front in one pass.
+
+    - An OutlineNode's ``ElementChildNodesOfVersionHistory`` lists its
+      top-level children.  Elements in that set are at indent level 0;
+      elements NOT in the set are nested deeper.
+    - When a table cell is recently edited, OneNote may store its content
+      under a new revision GUID that lands earlier in the flat object
+      list, referenced by the cell's ``ElementChildNodesOfVersionHistory``.
+      Those referenced objects are recorded so the main loop can skip them
+      (they will be pulled in by ``_extract_table`` instead).
+    """
+    identity_map: dict[str, int] = {}
+    list_node_map: dict[str, dict[str, object]] = {}
+    top_level_oe_ids: set[str] = set()
 
+    # Cell child-ref GUIDs, and a bitmap flagging the inline content that
+    # immediately follows each cell (up to the next cell, row or table).
+    # Dense per-index flags: a bytearray avoids hashing every index.
+    cell_refs: list[str] = []
+    inline_bitmap = bytearray(len(objects))
+    in_cell = False
 
-def _build_top_level_oe_ids(
-    objects: list[ExtractedObject],
-) -> set[str]:
-    """Identify OutlineElement identities that are direct children of OutlineNodes.
+    for idx, obj in enumerate(objects):
+        obj_type = obj.obj_type
+        if obj.identity:
+            identity_map[obj.identity] = idx
 
-    An OutlineNode's ``ElementChildNodesOfVersionHistory`` lists its
-    top-level children.  Elements in that set are at indent level 0;
-    elements NOT in the set are nested deeper.
-    """
-    top_ids: set[str] = set()
-    for obj in objects:
-        if obj.obj_type != _OUTLINE_NODE:
+        if obj_type == _TABLE_CELL:
+            cell_refs.extend(
+                obj.properties.get("ElementChildNodesOfVersionHistory", [])
+            )
+            in_cell = True
+            continue
+        if obj_type == _TABLE_ROW or obj_type == _TABLE_NODE:
+            in_cell = False
             continue
-        refs = obj.properties.get("ElementChildNodesOfVersionHistory", [])
-        if isinstance(refs, str):
-            refs = [refs]
-        if isinstance(refs, list):
-            for ref in refs:
-                if isinstance(ref, str):
-                    top_ids.add(ref)
-    return top_ids
+        if in_cell:
+            inline_bitmap[idx] = 1
+
+        if obj_type == _NUMBER_LIST:
+            # Read-only: shared with the object rather than copied.
+            list_node_map[obj.identity] = obj.properties
+        elif obj_type == _OUTLINE_NODE:
+            top_level_oe_ids.update(
+                obj.properties.get("ElementChildNodesOfVersionHistory", [])
+            )
+
+    # For each ref, if its target is OUTSIDE the inline table region,
+    # it's out-of-line content that should be skipped in the main loop.
+    out_of_line: set[int] = set()
+    for ref in cell_refs:
+        ref_idx = identity_map.get(ref)
+        if ref_idx is None or inline_bitmap[ref_idx]:
+            continue
+        # Walk forward from the ref, collecting the outline group
+        j = ref_idx
+        while j < len(objects):
+            if objects[j].obj_type in _OUTLINE_GROUP_TYPES:
+                out_of_line.add(j)
+                j += 1
+            else:
+                break
+
+    return _PageIndex(
+        identity_map=identity_map,
+        list_node_map=list_node_map,
+        top_level_oe_ids=top_level_oe_ids,
+        out_of_line=out_of_line,
+    )
 
 
 def _resolve_list_info(
@@ -513,7 +532,7 @@ def _resolve_list_info(
 def _build_page(
     extracted: ExtractedPage,
     file_data: dict[str, bytes],
-    paragraph_styles: dict[str, str] | None = None,
+    heading_levels: dict[str, int] | None = None,
 ) -> Page:
     """Build a Page model from an ExtractedPage."""
     page = Page(
@@ -524,26 +543,29 @@ def _build_page(
 
     # Deduplicate objects: OneNote revisions repeat the full content.
     # Remove objects that are exact duplicates (same type + same text content).
-    deduped_objects = _deduplicate_objects(extracted.objects)
+    # Text decoded while fingerprinting is kept for extraction below.
+    text_cache: dict[int, str] = {}
+    deduped_objects = _deduplicate_objects(extracted.objects, text_cache)
 
     # Reorder objects so that recently-edited content appears after
     # its parent OutlineElement rather than at the top of the list.
     deduped_objects = _reorder_by_outline_hierarchy(deduped_objects)
 
-    # Pre-scan: identify objects that are out-of-line table cell content.
-    # These are stored earlier in the list but referenced by a cell's
-    # ElementChildNodesOfVersionHistory GUID.  They must be skipped in
-    # the main loop so they only appear inside the table.
-    skip_indices = _find_out_of_line_table_refs(deduped_objects)
-
-    # Pre-scan: build list resolution data structures.
-    list_node_map = _build_list_node_map(deduped_objects)
-    top_level_oe_ids = _build_top_level_oe_ids(deduped_objects)
+    # Pre-scan (one pass): identity lookup, list resolution data, and
+    # out-of-line table cell content.  The latter is stored earlier in the
+    # list but referenced by a cell's ElementChildNodesOfVersionHistory
+    # GUID; it must be skipped in the main loop so it only appears inside
+    # the table.
+    index = _prescan(deduped_objects)
+    identity_map = index.identity_map
+    list_node_map = index.list_node_map
+    top_level_oe_ids = index.top_level_oe_ids
+    skip_indices = index.out_of_line
 
     # Process objects in order, building content elements.
     # Use index-based iteration so table processing can consume
     # subsequent row/cell/content objects.
-    current_style: dict[str, object] = {}
+    current_style = _TextStyle()
     list_info: _ListInfo | None = None
     list_info_used = False  # True once a non-empty RT used list_info
     i = 0
@@ -556,7 +578,9 @@ def _build_page(
         obj = deduped_objects[i]
 
         if obj.obj_type == _STYLE_CONTAINER:
-            current_style = dict(obj.properties)
+            # Resolved once here rather than for every text run that
+            # follows the container.
+            current_style = _text_style(obj.properties)
             i += 1
             continue
 
@@ -588,7 +612,8 @@ def _build_page(
                 obj,
                 current_style,
                 list_info,
-                paragraph_styles,
+                heading_levels,
+                text_cache,
             )
             if element:
                 page.elements.append(element)
@@ -613,6 +638,8 @@ def _build_page(
                 i,
                 current_style,
                 file_data,
+                identity_map,
+                text_cache,
             )
             if element:
                 page.elements.append(element)
@@ -632,7 +659,7 @@ def _build_page(
 
         # Skip table row/cell nodes that weren't consumed by a table
         # (shouldn't happen, but be defensive)
-        if obj.obj_type in (_TABLE_ROW, _TABLE_CELL):
+        if obj.obj_type in _CELL_BOUNDARY_TYPES:
             i += 1
             continue
 
@@ -654,7 +681,14 @@ def _dedup_elements(elements: list[ContentElement]) -> list[ContentElement]:
     result: list[ContentElement] = []
     for elem in elements:
         if isinstance(elem, RichText):
-            text = " ".join(r.text for r in elem.runs).strip()
+            runs = elem.runs
+            # Most paragraphs are a single run: key on its text directly
+            # (strip() returns the same object when there is nothing to
+            # strip) instead of going through a generator and join.
+            if len(runs) == 1:
+                text = runs[0].text.strip()
+            else:
+                text = " ".join(r.text for r in runs).strip()
             key = (text, elem.list_type)
             if key in seen:
                 continue
@@ -665,80 +699,60 @@ def _dedup_elements(elements: list[ContentElement]) -> list[ContentElement]:
 
 def _extract_rich_text(
     obj: ExtractedObject,
-    style: dict[str, object],
+    style: _TextStyle,
     list_info: _ListInfo | None,
-    paragraph_styles: dict[str, str] | None = None,
+    heading_levels: dict[str, int] | None = None,
+    text_cache: dict[int, str] | None = None,
 ) -> RichText | None:
-    """Extract rich text from a RichTextOENode."""
-    props = obj.properties
+    """Extract rich text from a RichTextOENode.
 
-    # Get text content - try RichEditTextUnicode first, then TextExtendedAscii
-    text = ""
-    raw_unicode = props.get("RichEditTextUnicode", "")
-    raw_ascii = props.get("TextExtendedAscii", "")
+    *text_cache* may hold the object's already-decoded text, keyed by
+    ``id(obj)`` (see ``_deduplicate_objects``).
+    """
+    props = obj.properties
 
-    if raw_unicode:
-        text = _decode_text_value(raw_unicode, encoding="unicode")
-    elif raw_ascii:
-        text = _decode_text_value(raw_ascii, encoding="ascii")
+    text = text_cache.get(id(obj)) if text_cache else None
+    if text is None:
+        text = _decode_rich_text(props)
 
     if not text or not text.strip():
         return None
 
-    # Get formatting from the style context
-    bold = _as_bool(style.get("Bold", False))
-    italic = _as_bool(style.get("Italic", False))
-    underline = _as_bool(style.get("Underline", False))
-    strikethrough = _as_bool(style.get("Strikethrough", False))
-    superscript = _as_bool(style.get("Superscript", False))
-    subscript = _as_bool(style.get("Subscript", False))
-    font = _clean_text(str(style.get("Font", "")))
-    font_size = _parse_font_size(style.get("FontSize", 0))
-
     # Check for HYPERLINK field codes embedded in the text
     # (collapsible sections store URLs as field codes in the text itself)
-    has_field_code = "\uFDDF" in text or "\uFDF3" in text
-    wz_hyperlink = _clean_text(str(props.get("WzHyperlinkUrl", "")))
+    has_field_code = _FIELD_MARKER_RE.search(text) is not None
+    # Most runs carry no hyperlink; skip cleaning when it is absent.
+    wz_hyperlink = props.get("WzHyperlinkUrl")
+    wz_hyperlink = _clean_text(str(wz_hyperlink)) if wz_hyperlink is not None else ""
 
     # Check if this is title text
     is_title = _as_bool(props.get("IsTitleText", False))
 
     # Resolve heading level from ParagraphStyle OSID reference
-    heading_level = _resolve_heading_level(props, paragraph_styles)
+    heading_level = _resolve_heading_level(props, heading_levels)
 
     # Build text runs — may produce multiple runs when field codes are mixed
     # with regular text that has its own WzHyperlinkUrl.
-    runs: list[TextRun] = []
     if has_field_code:
         segments = _parse_hyperlink_field_codes(text)
-        for i, (seg_text, seg_url) in enumerate(segments):
-            # First segment without a field-code URL inherits WzHyperlinkUrl
-            url = seg_url if seg_url else (wz_hyperlink if i == 0 else "")
-            runs.append(TextRun(
-                text=seg_text,
-                bold=bold,
-                italic=italic,
-                underline=underline,
-                strikethrough=strikethrough,
-                superscript=superscript,
-                subscript=subscript,
-                font=font,
-                font_size=font_size,
-                hyperlink_url=url,
-            ))
     else:
-        runs.append(TextRun(
-            text=text,
-            bold=bold,
-            italic=italic,
-            underline=underline,
-            strikethrough=strikethrough,
-            superscript=superscript,
-            subscript=subscript,
-            font=font,
-            font_size=font_size,
-            hyperlink_url=wz_hyperlink,
-        ))
+        segments = [(text, "")]
+    # First segment without a field-code URL inherits WzHyperlinkUrl
+    runs = [
+        TextRun(
+            text=seg_text,
+            bold=style.bold,
+            italic=style.italic,
+            underline=style.underline,
+            strikethrough=style.strikethrough,
+            superscript=style.superscript,
+            subscript=style.subscript,
+            font=style.font,
+            font_size=style.font_size,
+            hyperlink_url=seg_url or (wz_hyperlink if i == 0 else ""),
+        )
+        for i, (seg_text, seg_url) in enumerate(segments)
+    ]
 
     indent_level = 0
     list_type = ""
@@ -755,19 +769,34 @@ def _extract_rich_text(
     )
 
 
+def _heading_levels(paragraph_styles: dict[str, str] | None) -> dict[str, int]:
+    """Map paragraph style CompactIDs to heading levels.
+
+    Each CompactID maps to a ``jcidParagraphStyleObjectForText`` whose
+    ``ParagraphStyleId`` is "h1"–"h6", "p", "PageTitle", etc.  Only the
+    heading styles are kept.
+    """
+    if not paragraph_styles:
+        return {}
+    return {
+        style_ref: _HEADING_STYLE_MAP[style_id]
+        for style_ref, style_id in paragraph_styles.items()
+        if style_id in _HEADING_STYLE_MAP
+    }
+
+
 def _resolve_heading_level(
     props: dict[str, object],
-    paragraph_styles: dict[str, str] | None,
+    heading_levels: dict[str, int] | None,
 ) -> int:
     """Resolve the heading level from a RichTextOENode's ParagraphStyle.
 
     The ParagraphStyle property is an OSID reference (list of CompactID
-    strings).  Each CompactID maps to a ``jcidParagraphStyleObjectForText``
-    whose ``ParagraphStyleId`` is "h1"–"h6", "p", "PageTitle", etc.
+    strings), looked up in *heading_levels* (see ``_heading_levels``).
 
     Returns 1–6 for headings, 0 for normal text.
     """
-    if not paragraph_styles:
+    if not heading_levels:
         return 0
 
     para_style = props.get("ParagraphStyle")
@@ -775,10 +804,7 @@ def _resolve_heading_level(
         return 0
 
     # The first entry is the CompactID string for the paragraph style
-    style_ref = str(para_style[0])
-    style_id = paragraph_styles.get(style_ref, "")
-
-    return _HEADING_STYLE_MAP.get(style_id, 0)
+    return heading_levels.get(str(para_style[0]), 0)
 
 
 def _extract_image(
@@ -789,8 +815,8 @@ def _extract_image(
 
     filename = _clean_text(str(props.get("ImageFilename", "")))
     alt_text = _clean_text(str(props.get("ImageAltText", "")))
-    width = _parse_int_prop(props.get("PictureWidth", 0))
-    height = _parse_int_prop(props.get("PictureHeight", 0))
+    width = parse_int_prop(props.get("PictureWidth", 0))
+    height = parse_int_prop(props.get("PictureHeight", 0))
 
     # Try to find image data
     data = b""
@@ -825,8 +851,10 @@ def _extract_table(
     obj: ExtractedObject,
     objects: list[ExtractedObject],
     table_idx: int,
-    style: dict[str, object],
+    style: _TextStyle,
     file_data: dict[str, bytes],
+    identity_map: dict[str, int],
+    text_cache: dict[int, str] | None = None,
 ) -> tuple[TableElement | None, int, set[int]]:
     """Extract table with rows and cell content from a TableNode.
 
@@ -838,43 +866,34 @@ def _extract_table(
     are reversed to produce the natural reading order.
 
     Recently edited cells may have their content stored out-of-line
-    (earlier in the object list) and referenced by GUID.  A lookup map
-    is built so that cells with no inline content can resolve their
-    referenced objects.
+    (earlier in the object list) and referenced by GUID.  Cells with no
+    inline content resolve their referenced objects through
+    *identity_map* (identity → index into *objects*).
 
     Returns (element, consumed) where *consumed* is the number of objects
     after the TableNode that were part of this table.
     """
     props = obj.properties
-    row_count = _parse_int_prop(props.get("RowCount", 0))
-    col_count = _parse_int_prop(props.get("ColumnCount", 0))
+    row_count = parse_int_prop(props.get("RowCount", 0))
+    col_count = parse_int_prop(props.get("ColumnCount", 0))
     borders = _as_bool(props.get("TableBordersVisible", True))
 
     if row_count == 0 or col_count == 0:
         return None, 0, set()
 
-    # Build identity → index lookup so out-of-line cell content can be
-    # resolved.  Identity strings look like:
-    #   '<ExtendedGUID> (guid-here, 138)'
-    identity_map: dict[str, int] = {}
-    for idx, o in enumerate(objects):
-        if o.identity:
-            identity_map[o.identity] = idx
-
     # Track which objects have been consumed as out-of-line cell content
     # so _build_page can skip them later.
     out_of_line_indices: set[int] = set()
 
     rows: list[list[list[ContentElement]]] = []
-    consumed = 0
-    i = table_idx + 1  # start after the TableNode
+    start = table_idx + 1  # first object after the TableNode
+    i = start
 
     while i < len(objects) and len(rows) < row_count:
         row_obj = objects[i]
         if row_obj.obj_type != _TABLE_ROW:
             break
 
-        consumed += 1
         i += 1
 
         # Collect cells for this row
@@ -884,7 +903,6 @@ def _extract_table(
             if cell_obj.obj_type != _TABLE_CELL:
                 break
 
-            consumed += 1
             i += 1
 
             # Each cell's ElementChildNodesOfVersionHistory tells us
@@ -893,14 +911,14 @@ def _extract_table(
             child_refs = cell_obj.properties.get(
                 "ElementChildNodesOfVersionHistory", []
             )
-            max_outlines = len(child_refs) if isinstance(child_refs, list) else 1
+            max_outlines = len(child_refs)
 
             # --- Inline content (objects immediately after the cell) ---
             cell_elements: list[ContentElement] = []
             outlines_seen = 0
             while i < len(objects):
                 inner = objects[i]
-                if inner.obj_type in (_TABLE_CELL, _TABLE_ROW):
+                if inner.obj_type in _CELL_BOUNDARY_TYPES:
                     break
 
                 if inner.obj_type == _OUTLINE_ELEMENT:
@@ -908,13 +926,14 @@ def _extract_table(
                     if outlines_seen > max_outlines:
                         break
 
-                consumed += 1
                 i += 1
 
                 if inner.obj_type == _OUTLINE_ELEMENT:
                     continue
                 if inner.obj_type == _RICH_TEXT:
-                    elem = _extract_rich_text(inner, style, None)
+                    elem = _extract_rich_text(
+                        inner, style, None, text_cache=text_cache
+                    )
                     if elem:
                         cell_elements.append(elem)
                 elif inner.obj_type == _IMAGE_NODE:
@@ -929,7 +948,7 @@ def _extract_table(
             # --- Out-of-line content (referenced by GUID) ---
             # If the cell had no inline content, look up its child refs
             # in the identity map to find content stored elsewhere.
-            if not cell_elements and isinstance(child_refs, list):
+            if not cell_elements:
                 for ref in child_refs:
                     ref_idx = identity_map.get(ref)
                     if ref_idx is None:
@@ -945,7 +964,9 @@ def _extract_table(
                             continue
                         if robj.obj_type == _RICH_TEXT:
                             out_of_line_indices.add(j)
-                            elem = _extract_rich_text(robj, style, None)
+                            elem = _extract_rich_text(
+                                robj, style, None, text_cache=text_cache
+                            )
                             if elem:
                                 cell_elements.append(elem)
                             j += 1
@@ -969,7 +990,8 @@ def _extract_table(
     rows.reverse()
 
     table = TableElement(rows=rows, borders_visible=borders)
-    return table, consumed, out_of_line_indices
+    # Everything between the TableNode and the cursor belongs to the table.
+    return table, i - start, out_of_line_indices
 
 
 def _extract_embedded_file(
@@ -995,6 +1017,20 @@ def _extract_embedded_file(
     )
 
 
+def _decode_rich_text(props: dict[str, object]) -> str:
+    """Decode a RichTextOENode's text.
+
+    Tries RichEditTextUnicode first, then TextExtendedAscii.
+    """
+    raw_unicode = props.get("RichEditTextUnicode", "")
+    if raw_unicode:
+        return _decode_text_value(raw_unicode, encoding="unicode")
+    raw_ascii = props.get("TextExtendedAscii", "")
+    if raw_ascii:
+        return _decode_text_value(raw_ascii, encoding="ascii")
+    return ""
+
+
 def _decode_text_value(value: object, encoding: str = "unicode") -> str:
     """Decode text from pyOneNote property values.
 
@@ -1003,24 +1039,24 @@ def _decode_text_value(value: object, encoding: str = "unicode") -> str:
     - Hex string for TextExtendedAscii
     - Garbled UTF-16 decoded strings for TextExtendedAscii (needs re-encoding)
     - bytes for raw data
+
+    Decoded text goes straight to ``_clean_text``, which already deletes
+    every NUL, so trailing terminators need no separate ``rstrip``.
     """
     if isinstance(value, str):
         cleaned = value.strip()
         if not cleaned:
             return ""
 
-        # Check if it's a hex string (common for TextExtendedAscii)
-        if all(c in "0123456789abcdefABCDEF" for c in cleaned):
+        # Check if it's a hex string (common for TextExtendedAscii).
+        # Odd lengths would fail bytes.fromhex anyway.
+        if len(cleaned) % 2 == 0 and _is_hex(cleaned):
             try:
                 raw = bytes.fromhex(cleaned)
                 if encoding == "ascii":
-                    return _clean_text(
-                        raw.decode("ascii", errors="replace").rstrip("\x00")
-                    )
+                    return _clean_text(raw.decode("ascii", errors="replace"))
                 else:
-                    return _clean_text(
-                        raw.decode("utf-16-le", errors="replace").rstrip("\x00")
-                    )
+                    return _clean_text(raw.decode("utf-16-le", errors="replace"))
             except (ValueError, UnicodeDecodeError):
                 pass
 
@@ -1031,7 +1067,7 @@ def _decode_text_value(value: object, encoding: str = "unicode") -> str:
         if encoding == "ascii" and _looks_garbled(cleaned):
             try:
                 raw = cleaned.encode("utf-16-le")
-                return _clean_text(raw.decode("ascii", errors="replace").rstrip("\x00"))
+                return _clean_text(raw.decode("ascii", errors="replace"))
             except (UnicodeEncodeError, UnicodeDecodeError):
                 pass
 
@@ -1039,15 +1075,27 @@ def _decode_text_value(value: object, encoding: str = "unicode") -> str:
 
     if isinstance(value, bytes):
         if encoding == "ascii":
-            return _clean_text(value.decode("ascii", errors="replace").rstrip("\x00"))
+            return _clean_text(value.decode("ascii", errors="replace"))
         try:
-            return _clean_text(value.decode("utf-16-le").rstrip("\x00"))
+            return _clean_text(value.decode("utf-16-le"))
         except UnicodeDecodeError:
-            return _clean_text(value.decode("latin-1").rstrip("\x00"))
+            return _clean_text(value.decode("latin-1"))
 
     return _clean_text(str(value)) if value else ""
 
 
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+
+def _is_hex(text: str) -> bool:
+    """Return True if *text* consists only of hex digits.
+
+    Deleting the hex digits with ``bytes.translate`` runs in C, rather
+    than testing each character in a Python-level generator.
+    """
+    return text.isascii() and not text.encode("ascii").translate(None, _HEX_DIGITS)
+
+
 def _looks_garbled(text: str) -> bool:
     """Detect if text looks like ASCII bytes misinterpreted as UTF-16LE.
 
@@ -1055,12 +1103,14 @@ def _looks_garbled(text: str) -> bool:
     UTF-16 strings instead of ASCII. The result contains CJK characters,
     unusual symbols, and zero-width spaces for normal English text.
     """
-    if not text:
+    if len(text) <= 2 or text.isascii():
+        # isascii() is O(1) on CPython and covers nearly all real text.
         return False
-    # Count characters outside normal ASCII+extended range
-    non_ascii = sum(1 for c in text if ord(c) > 0xFF)
+    # Count characters outside normal ASCII+extended range: Latin-1
+    # encoding drops exactly those, without a Python-level loop.
+    non_ascii = len(text) - len(text.encode("latin-1", errors="ignore"))
     # If more than 30% of characters are non-ASCII, it's likely garbled
-    return len(text) > 2 and non_ascii / len(text) > 0.3
+    return non_ascii / len(text) > 0.3
 
 
 def _parse_hyperlink_field_codes(text: str) -> list[tuple[str, str]]:
@@ -1080,74 +1130,61 @@ def _parse_hyperlink_field_codes(text: str) -> list[tuple[str, str]]:
     if not text:
         return [(text, "")]
 
+    # The raw text is split, not the cleaned text: cleaning deletes \x0b,
+    # which the field code regex must still see as whitespace.
+    # With its two groups, split() yields the text around each field code
+    # followed by the code's url and display text, all in one C-level scan:
+    # [plain, url, display, plain, url, display, ..., plain]
+    parts = _HYPERLINK_FIELD_RE.split(text)
     segments: list[tuple[str, str]] = []
-    remaining = text
-
-    while remaining:
-        match = _HYPERLINK_FIELD_RE.search(remaining)
-        if not match:
-            cleaned = _clean_text(remaining)
-            if cleaned:
-                segments.append((cleaned, ""))
-            break
 
+    for k in range(0, len(parts) - 1, 3):
         # Text before the field code marker
-        prefix = remaining[: match.start()]
-        prefix_clean = _clean_text(prefix)
+        prefix_clean = _clean_text(parts[k])
         if prefix_clean:
             segments.append((prefix_clean, ""))
 
-        url = _clean_text(match.group(1))
-        display = _clean_text(match.group(2))
+        url = _clean_text(parts[k + 1])
+        display = _clean_text(parts[k + 2])
         if display:
             segments.append((display, url))
         elif url:
             segments.append((url, url))
 
-        remaining = remaining[match.end() :]
+    tail = _clean_text(parts[-1])
+    if tail:
+        segments.append((tail, ""))
 
     return segments if segments else [(text, "")]
 
 
-def _section_name_from_path(file_path: str) -> str:
-    """Extract a clean section name from a file path."""
-    name = Path(file_path).stem
-    name = re.sub(r"\s*\(On\s+\d+-\d+-\d+(?:\s*-\s*\d+)?\)", "", name)
-    name = re.sub(r"\.one$", "", name, flags=re.IGNORECASE)
-    return name.strip() or "Untitled"
+# Null bytes and vertical tabs (common OneNote artifacts) and the Unicode
+# replacement character are dropped; narrow no-break spaces (U+202F)
+# become regular spaces.
+_CLEAN_TABLE = str.maketrans({0x00: None, 0x0B: None, 0xFFFD: None, 0x202F: " "})
 
 
 def _clean_text(text: str) -> str:
     """Clean text by removing null bytes, control characters, and replacement chars."""
-    # Remove null bytes and vertical tabs (common OneNote artifacts)
-    text = text.replace("\x00", "").replace("\x0b", "")
-    # Replace narrow no-break space (U+202F) with regular space
-    text = text.replace("\u202f", " ")
-    # Remove Unicode replacement character (U+FFFD)
-    text = text.replace("\ufffd", "")
-    return text.strip()
+    return text.translate(_CLEAN_TABLE).strip()
 
 
-def _as_bool(value: object) -> bool:
-    """Convert a property value to bool."""
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, str):
-        return value.lower() in ("true", "1", "yes")
-    return bool(value)
+_TRUE_STRINGS = frozenset({"true", "1", "yes"})
 
 
-def _parse_int_prop(value: object) -> int:
-    """Parse an integer property."""
-    if isinstance(value, int):
-        return value
-    if isinstance(value, bytes) and len(value) >= 2:
-        return int.from_bytes(value[:4].ljust(4, b"\x00"), "little")
+def _as_bool(value: object) -> bool:
+    """Convert a property value to bool.
+
+    Most formatting flags arrive as real booleans or are absent, so the
+    identity checks come first.
+    """
+    if value is True:
+        return True
+    if value is False or value is None:
+        return False
     if isinstance(value, str):
-        match = re.search(r"\d+", value)
-        if match:
-            return int(match.group())
-    return 0
+        return value.lower() in _TRUE_STRINGS
+    return bool(value)
 
 
 def _parse_byte_prop_as_int(value: object) -> int:
@@ -1156,47 +1193,44 @@ def _parse_byte_prop_as_int(value: object) -> int:
     pyOneNote stores short binary properties as either actual ``bytes``
     or as their ``repr()`` string (e.g. ``"b'$\\x00'"``, ``"b'\\x04\\x00'"``).
     """
-    if isinstance(value, int):
-        return value
-    if isinstance(value, bytes) and len(value) >= 2:
-        return int.from_bytes(value[:2], "little")
     if isinstance(value, str):
         # Try to recover bytes from repr string like "b'$\x00'"
-        if value.startswith("b'") or value.startswith('b"'):
-            try:
-                raw = ast.literal_eval(value)
-                if isinstance(raw, bytes) and len(raw) >= 2:
-                    return int.from_bytes(raw[:2], "little")
-            except (ValueError, SyntaxError):
-                pass
-    return 0
-
-
-def _parse_font_size(value: object) -> int:
-    """Parse font size from pyOneNote format."""
+        value = bytes_from_repr(value) if value.startswith(("b'", 'b"')) else None
+    if isinstance(value, bytes):
+        return U16.unpack_from(value)[0] if len(value) >= 2 else 0
     if isinstance(value, int):
         return value
-    if isinstance(value, bytes):
-        return int.from_bytes(value[:2].ljust(2, b"\x00"), "little")
-    if isinstance(value, str):
-        match = re.search(r"\d+", value)
-        if match:
-            return int(match.group())
     return 0
 
 
+# Leading magic bytes → image format.  WebP needs a second check (see
+# _detect_image_format) since RIFF is a generic container.
+_IMAGE_MAGIC: tuple[tuple[bytes, str], ...] = (
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+    (b"BM", "bmp"),
+    (b"RIFF", "webp"),
+)
+
+# The same table keyed by first byte, so most data is rejected or
+# matched with a single dict probe.
+_IMAGE_MAGIC_BY_LEAD: dict[int, tuple[tuple[bytes, str], ...]] = {
+    lead: tuple(entry for entry in _IMAGE_MAGIC if entry[0][0] == lead)
+    for lead in {magic[0] for magic, _ in _IMAGE_MAGIC}
+}
+
+
 def _detect_image_format(data: bytes) -> str:
-    """Detect image format from magic bytes."""
+    """Detect image format from magic bytes.
+
+    Candidates are looked up by the first byte (an int, so no slice is
+    allocated) and confirmed with ``startswith``.
+    """
     if not data or len(data) < 4:
         return ""
-    if data[:8] == b"\x89PNG\r\n\x1a\n":
-        return "png"
-    if data[:3] == b"\xff\xd8\xff":
-        return "jpeg"
-    if data[:6] in (b"GIF87a", b"GIF89a"):
-        return "gif"
-    if data[:2] == b"BM":
-        return "bmp"
-    if data[:4] == b"RIFF" and len(data) > 8 and data[8:12] == b"WEBP":
-        return "webp"
+    for magic, fmt in _IMAGE_MAGIC_BY_LEAD.get(data[0], ()):
+        if data.startswith(magic) and (fmt != "webp" or data.startswith(b"WEBP", 8)):
+            return fmt
     return ""
@@ -7,6 +7,7 @@ and organizes it by page.
 import logging
 import re
 import struct
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -14,8 +15,14 @@ from pyOneNote.Header import Header
 from pyOneNote.OneDocument import OneDocment
 from pyOneNote.FileNode import PropertyID, PropertySet, ObjectSpaceObjectPropSet
 
+from onenote_export.utils import U16, U32, parse_int_prop
+
 logger = logging.getLogger(__name__)
 
+# Byte widths of the fixed-size property types (1, 2, 4 and 8 bytes),
+# which are stored as raw bytes.
+_FIXED_WIDTH_PTYPES = {0x3: 1, 0x4: 2, 0x5: 4, 0x6: 8}
+
 
 def _patch_pyonenote() -> None:
     """Monkey-patch pyOneNote to fix bugs and add missing features.
@@ -52,7 +59,7 @@ def _patch_pyonenote() -> None:
         self, file, OIDs=None, OSIDs=None, ContextIDs=None, document=None
     ):
         self.current = file.tell()
-        (self.cProperties,) = struct.unpack("<H", file.read(2))
+        (self.cProperties,) = U16.unpack(file.read(2))
         self.rgPrids = []
         self.indent = ""
         self.document = document
@@ -69,14 +76,12 @@ def _patch_pyonenote() -> None:
                 self.rgData.append(None)
             elif ptype == 0x2:
                 self.rgData.append(self.rgPrids[i].boolValue)
-            elif ptype == 0x3:
-                self.rgData.append(struct.unpack("c", file.read(1))[0])
-            elif ptype == 0x4:
-                self.rgData.append(struct.unpack("2s", file.read(2))[0])
-            elif ptype == 0x5:
-                self.rgData.append(struct.unpack("4s", file.read(4))[0])
-            elif ptype == 0x6:
-                self.rgData.append(struct.unpack("8s", file.read(8))[0])
+            elif ptype in _FIXED_WIDTH_PTYPES:
+                size = _FIXED_WIDTH_PTYPES[ptype]
+                data = file.read(size)
+                if len(data) != size:
+                    raise struct.error(f"unpack requires a buffer of {size} bytes")
+                self.rgData.append(data)
             elif ptype == 0x7:
                 from pyOneNote.FileNode import PrtFourBytesOfLengthFollowedByData
 
@@ -84,21 +89,21 @@ def _patch_pyonenote() -> None:
             elif ptype in (0x8, 0x9):
                 count = 1
                 if ptype == 0x9:
-                    (count,) = struct.unpack("<I", file.read(4))
+                    (count,) = U32.unpack(file.read(4))
                 self.rgData.append(PropertySet.get_compact_ids(OIDs, count))
             elif ptype in (0xA, 0xB):
                 count = 1
                 if ptype == 0xB:
-                    (count,) = struct.unpack("<I", file.read(4))
+                    (count,) = U32.unpack(file.read(4))
                 self.rgData.append(PropertySet.get_compact_ids(OSIDs, count))
             elif ptype in (0xC, 0xD):
                 count = 1
                 if ptype == 0xD:
-                    (count,) = struct.unpack("<I", file.read(4))
+                    (count,) = U32.unpack(file.read(4))
                 self.rgData.append(PropertySet.get_compact_ids(ContextIDs, count))
             elif ptype == 0x10:
                 # ArrayOfPropertyValues (MS-ONESTORE section 2.6.9)
-                (arr_count,) = struct.unpack("<I", file.read(4))
+                (arr_count,) = U32.unpack(file.read(4))
                 child_sets = []
                 if arr_count > 0:
                     # Read prid (must have type 0x11); we validate but
@@ -145,6 +150,26 @@ _NUMBER_LIST = "jcidNumberListNode"
 _STYLE_CONTAINER = "jcidPersistablePropertyContainerForTOCSection"
 _REVISION_META = "jcidRevisionMetaData"
 
+# Object types that make up a page's content.
+_CONTENT_TYPES = frozenset(
+    {
+        _RICH_TEXT,
+        _IMAGE_NODE,
+        _TABLE_NODE,
+        _TABLE_ROW,
+        _TABLE_CELL,
+        _EMBEDDED_FILE,
+        _OUTLINE_ELEMENT,
+        _OUTLINE_NODE,
+        _NUMBER_LIST,
+    }
+)
+
+_CHILD_REFS = "ElementChildNodesOfVersionHistory"
+
+# GUID part of an ExtendedGUID identity string: '<ExtendedGUID> (guid, n)'.
+_GUID_RE = re.compile(r"\(([^,]+),")
+
 
 @dataclass
 class ExtractedProperty:
@@ -154,16 +179,29 @@ class ExtractedProperty:
     value: object  # str, bytes, int, bool, list, etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedObject:
     """A parsed object from the OneNote file."""
 
     obj_type: str
     identity: str
     properties: dict[str, object] = field(default_factory=dict)
-
-
-@dataclass
+    # GUID part of ``identity``, extracted once on construction.
+    guid: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        self.guid = _extract_guid(self.identity)
+        # Child refs arrive as a single string or a list; store a list of
+        # strings so consumers can iterate it directly.  The caller's dict
+        # is copied rather than modified when a change is needed.
+        refs = self.properties.get(_CHILD_REFS)
+        if refs is not None:
+            normalized = _normalize_child_refs(refs)
+            if normalized != refs:
+                self.properties = {**self.properties, _CHILD_REFS: normalized}
+
+
+@dataclass(slots=True)
 class ExtractedPage:
     """A page with its title and content objects."""
 
@@ -221,13 +259,17 @@ class OneStoreParser:
         # Extract paragraph styles from ReadOnly object declarations
         section.paragraph_styles = self._extract_paragraph_styles(doc)
 
-        # Convert raw properties to ExtractedObjects
+        # Convert raw properties to ExtractedObjects.  Type names and
+        # property names are interned so the extractor's many comparisons
+        # and lookups against its string constants hit the identity fast
+        # path.  ExtractedObject normalizes the child refs itself.
         all_objects = []
         for raw in raw_props:
+            properties = {sys.intern(k): v for k, v in raw["val"].items()}
             obj = ExtractedObject(
-                obj_type=raw["type"],
+                obj_type=sys.intern(raw["type"]),
                 identity=raw["identity"],
-                properties=dict(raw["val"]),
+                properties=properties,
             )
             all_objects.append(obj)
 
@@ -255,35 +297,39 @@ class OneStoreParser:
         OneDocment.traverse_nodes(doc.root_file_node_list, all_nodes, [])
 
         styles: dict[str, str] = {}
-        for node in all_nodes:
-            data = getattr(node, "data", None)
-            if data is None:
-                continue
-            if type(data).__name__ != "ReadOnlyObjectDeclaration2RefCountFND":
-                continue
-
-            base = data.base
-            ref_stp = base.ref.stp
-            ref_cb = base.ref.cb
-            if ref_stp == 0 or ref_cb == 0:
-                continue
-
-            try:
-                with open(self.file_path, "rb") as f:
+        decls = [
+            node.data
+            for node in all_nodes
+            if type(getattr(node, "data", None)).__name__
+            == "ReadOnlyObjectDeclaration2RefCountFND"
+        ]
+        if not decls:
+            return styles
+
+        # One handle for every declaration; each read seeks first.
+        with open(self.file_path, "rb") as f:
+            for data in decls:
+                base = data.base
+                ref_stp = base.ref.stp
+                ref_cb = base.ref.cb
+                if ref_stp == 0 or ref_cb == 0:
+                    continue
+
+                try:
                     f.seek(ref_stp)
                     prop_set = ObjectSpaceObjectPropSet(f, doc)
                     props = dict(prop_set.body.get_properties())
-            except Exception:
-                continue
+                except Exception:
+                    continue
 
-            style_id = props.get("ParagraphStyleId", "")
-            if not style_id:
-                continue
+                style_id = props.get("ParagraphStyleId", "")
+                if not style_id:
+                    continue
 
-            oid = str(base.body.oid)
-            # Clean the null terminator from the style ID
-            clean_id = style_id.replace("\x00", "").strip()
-            styles[oid] = clean_id
+                oid = str(base.body.oid)
+                # Clean the null terminator from the style ID
+                clean_id = style_id.replace("\x00", "").strip()
+                styles[oid] = clean_id
 
         return styles
 
@@ -313,98 +359,57 @@ class OneStoreParser:
         """
         pages: list[ExtractedPage] = []
 
-        # Classify every object by type, indexed by GUID
+        # Classify every object in a single pass, indexed by GUID.  The
+        # first PageNode of each GUID is kept; dict order gives the page
+        # order.  Later metadata entries (newer revisions) overwrite
+        # earlier ones.
         guid_objects: dict[str, list[ExtractedObject]] = {}
-        page_metas: list[ExtractedObject] = []
-        page_node_guids: list[str] = []
+        page_nodes: dict[str, ExtractedObject] = {}
+        meta_by_guid: dict[str, ExtractedObject] = {}
 
         for obj in objects:
-            guid = _extract_guid(obj.identity)
+            guid = obj.guid
             guid_objects.setdefault(guid, []).append(obj)
 
             if obj.obj_type == _PAGE_META:
-                page_metas.append(obj)
+                meta_by_guid[guid] = obj
             elif obj.obj_type == _PAGE_NODE:
-                if guid not in page_node_guids:
-                    page_node_guids.append(guid)
+                page_nodes.setdefault(guid, obj)
 
         # No page metadata at all — single unnamed page
-        if not page_metas:
-            all_content = [
-                o
-                for o in objects
-                if o.obj_type
-                in (
-                    _RICH_TEXT,
-                    _IMAGE_NODE,
-                    _TABLE_NODE,
-                    _TABLE_ROW,
-                    _TABLE_CELL,
-                    _EMBEDDED_FILE,
-                    _OUTLINE_ELEMENT,
-                    _OUTLINE_NODE,
-                    _NUMBER_LIST,
-                )
-            ]
+        if not meta_by_guid:
+            all_content = [o for o in objects if o.obj_type in _CONTENT_TYPES]
             if all_content:
                 pages.append(ExtractedPage(objects=all_content))
             return pages
 
-        # Build a lookup: GUID -> page metadata
-        meta_by_guid: dict[str, ExtractedObject] = {}
-        for meta in page_metas:
-            guid = _extract_guid(meta.identity)
-            # Later entries (newer revisions) overwrite earlier ones
-            meta_by_guid[guid] = meta
-
         # Orphan metas: metadata GUIDs with no page node (old revisions)
         orphan_metas: dict[str, ExtractedObject] = {
-            g: m for g, m in meta_by_guid.items() if g not in page_node_guids
-        }
-
-        # Content types we care about
-        _CONTENT_TYPES = {
-            _RICH_TEXT,
-            _IMAGE_NODE,
-            _TABLE_NODE,
-            _TABLE_ROW,
-            _TABLE_CELL,
-            _EMBEDDED_FILE,
-            _OUTLINE_ELEMENT,
-            _OUTLINE_NODE,
-            _NUMBER_LIST,
+            g: m for g, m in meta_by_guid.items() if g not in page_nodes
         }
 
         # Build one page per content GUID (GUID that has a PageNode)
         seen_titles: dict[str, int] = {}
-        for content_guid in page_node_guids:
-            objs = guid_objects.get(content_guid, [])
+        for content_guid, page_node in page_nodes.items():
+            objs = guid_objects[content_guid]
 
-            # Find metadata — prefer same GUID, fall back to orphan
+            # Find metadata — prefer same GUID, fall back to the first
+            # remaining orphan
             meta = meta_by_guid.get(content_guid)
-            if not meta:
-                # Match orphan metadata by scanning (first available)
-                for og, om in list(orphan_metas.items()):
-                    meta = om
-                    del orphan_metas[og]
-                    break
+            if not meta and orphan_metas:
+                meta = orphan_metas.pop(next(iter(orphan_metas)))
 
             title = ""
             level = 0
             creation = ""
             if meta:
                 title = _clean_text(str(meta.properties.get("CachedTitleString", "")))
-                level = _parse_int(meta.properties.get("PageLevel", 0))
+                level = parse_int_prop(meta.properties.get("PageLevel", 0))
                 creation = str(meta.properties.get("TopologyCreationTimeStamp", ""))
 
             # Extract author from the page node
-            author = ""
-            last_modified = ""
-            for o in objs:
-                if o.obj_type == _PAGE_NODE:
-                    author = _clean_text(str(o.properties.get("Author", "")))
-                    last_modified = str(o.properties.get("LastModifiedTime", ""))
-                    break
+            author = _clean_text(str(page_node.properties.get("Author", "")))
+            last_modified = str(page_node.properties.get("LastModifiedTime", ""))
 
             # Collect content objects for this GUID only
             content = [o for o in objs if o.obj_type in _CONTENT_TYPES]
@@ -437,30 +442,28 @@ def _extract_guid(identity_str: str) -> str:
     Input format: '<ExtendedGUID> (guid-string, n)'
     Returns just the guid-string part.
     """
-    match = re.search(r"\(([^,]+),", identity_str)
+    match = _GUID_RE.search(identity_str)
     if match:
         return match.group(1).strip()
     return ""
 
 
+def _normalize_child_refs(value: object) -> list[str]:
+    """Normalize an ElementChildNodesOfVersionHistory value to a list.
+
+    pyOneNote yields a single string for one ref and a list for several;
+    non-string entries are dropped.
+    """
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [ref for ref in value if isinstance(ref, str)]
+    return []
+
+
+_NULL_TABLE = str.maketrans({0x00: None})
+
+
 def _clean_text(text: str) -> str:
     """Clean up text by stripping null bytes and extra whitespace."""
-    text = text.replace("\x00", "").strip()
-    return text
-
-
-def _parse_int(value: object) -> int:
-    """Parse an integer from various formats pyOneNote returns."""
-    if isinstance(value, int):
-        return value
-    if isinstance(value, bytes):
-        try:
-            return int.from_bytes(value[:4], "little")
-        except Exception:
-            return 0
-    if isinstance(value, str):
-        # Try to extract numeric value
-        match = re.search(r"\d+", value)
-        if match:
-            return int(match.group())
-    return 0
+    return text.translate(_NULL_TABLE).strip()
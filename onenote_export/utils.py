@@ -1,41 +1,181 @@
 """Utility functions for the OneNote export tool."""
 
+import ast
+import functools
+import logging
+import os
 import re
+import struct
+from collections.abc import Iterator
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# O_BINARY only exists (and matters) on Windows, where it disables
+# newline translation.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Version suffix OneNote appends to backup copies: ' (On M-D-YY)' or
+# ' (On M-D-YY - N)'.  Groups capture month, day and year.
+_DATE_SUFFIX_RE = re.compile(r"\s*\(On\s+(\d+)-(\d+)-(\d+)(?:\s*-\s*\d+)?\)")
+_DIGITS_RE = re.compile(r"\d+")
+
+# Precompiled unpackers for the common little-endian property widths; public
+# because the parser modules use them too.
+U16 = struct.Struct("<H")
+U32 = struct.Struct("<I")
+
 
 def discover_one_files(input_dir: Path) -> list[Path]:
     """Recursively find all .one files in a directory.
 
     Excludes .onetoc2 table-of-contents files.
     """
-    files = sorted(
-        p
-        for p in input_dir.rglob("*.one")
-        if p.is_file() and not p.name.endswith(".onetoc2")
-    )
-    return files
+    return sorted(_scandir_walk(input_dir))
+
+
+def _scandir_walk(path: str | os.PathLike[str]) -> Iterator[Path]:
+    """Yield every .one file below *path* using ``os.scandir``.
+
+    Directory entries carry their file type, so no extra ``stat()`` call
+    is needed per file.  Directories are walked with an explicit stack
+    rather than nested generators, so deep trees neither pay for
+    ``yield from`` delegation at every level nor hit the recursion limit.
+    Symlinked directories are not followed (which also rules out cycles),
+    and unreadable directories are skipped.
+    """
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.warning("Skipping unreadable directory %s: %s", current, e)
+            continue
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif entry.name.lower().endswith(".one") and entry.is_file():
+                yield Path(entry.path)
 
 
+@functools.lru_cache(maxsize=4096)
 def section_name_from_filename(filename: str) -> str:
-    """Extract a clean section name from a .one filename.
+    """Extract a clean section name from a .one filename or path.
 
     Examples:
         'ADI (On 2-25-26).one' -> 'ADI'
         'ADP.one (On 8-24-25).one' -> 'ADP'
         'BMS (On 2-25-26).one' -> 'BMS'
     """
-    name = Path(filename).stem
+    name = os.path.splitext(os.path.basename(filename))[0]
 
-    # Strip ' (On M-D-YY)' or ' (On M-D-YY - N)' suffix
-    name = re.sub(r"\s*\(On\s+\d+-\d+-\d+(?:\s*-\s*\d+)?\)", "", name)
+    # Strip ' (On M-D-YY)' or ' (On M-D-YY - N)' suffix; the substring
+    # test skips the regex for the common undated names.
+    if "(On" in name:
+        name = _DATE_SUFFIX_RE.sub("", name)
 
     # Strip trailing '.one' that appears in 'Name.one (On date)' pattern
-    name = re.sub(r"\.one$", "", name, flags=re.IGNORECASE)
+    if name[-4:].lower() == ".one":
+        name = name[:-4]
 
     return name.strip() or "Untitled"
 
 
+def section_date_from_filename(filename: str) -> tuple[int, int, int]:
+    """Return the ``(year, month, day)`` of a backup copy's date suffix.
+
+    Two-digit years are read as 1950-2049.  Names without a date suffix
+    return ``(0, 0, 0)``, which sorts before any dated copy.
+
+    Examples:
+        'ADI (On 2-25-26).one' -> (2026, 2, 25)
+        'Notes.one' -> (0, 0, 0)
+    """
+    match = _DATE_SUFFIX_RE.search(filename)
+    if not match:
+        return (0, 0, 0)
+    month, day, year = (int(group) for group in match.groups())
+    if year < 100:
+        year += 2000 if year < 50 else 1900
+    return (year, month, day)
+
+
+def parse_int_prop(value: object, width: int = 4) -> int:
+    """Parse an integer from the formats pyOneNote returns for properties.
+
+    Ints are returned as-is.  Bytes, and their ``repr()`` strings (e.g.
+    ``"b'\\x0c\\x00\\x00\\x00'"``), are read as an unsigned little-endian
+    integer from their first *width* bytes.  Other strings yield their
+    first run of digits.  Anything else parses as 0.
+    """
+    # Exact type checks first: a single pointer compare for the types
+    # pyOneNote actually produces.
+    cls = type(value)
+    if cls is int:
+        return value
+    if cls is str:
+        raw = bytes_from_repr(value) if value.startswith(("b'", 'b"')) else None
+        if raw is None:
+            match = _DIGITS_RE.search(value)
+            return int(match.group()) if match else 0
+        value = raw
+    elif cls is not bytes:
+        # Subclasses such as bool, or unsupported types.
+        if isinstance(value, int):
+            return value
+        if isinstance(value, str):
+            return parse_int_prop(str(value), width)
+        if not isinstance(value, bytes):
+            return 0
+    if len(value) >= width:
+        if width == 4:
+            return U32.unpack_from(value)[0]
+        if width == 2:
+            return U16.unpack_from(value)[0]
+    return int.from_bytes(value[:width], "little")
+
+
+@functools.lru_cache(maxsize=128)
+def bytes_from_repr(value: str) -> bytes | None:
+    """Decode a bytes ``repr()`` string, or return None if it isn't one.
+
+    The framing is checked by hand so most non-literals are rejected
+    without invoking the parser; ``ast.literal_eval`` then decodes the
+    escapes.  Memoized: the same few repr strings recur across objects.
+    """
+    quote = value[1:2]
+    if len(value) < 3 or value[0] != "b" or quote not in "'\"" or value[-1] != quote:
+        return None
+    body = value[2:-1]
+    if quote in body.replace("\\\\", "").replace("\\" + quote, ""):
+        # An unescaped quote means this is not a single bytes literal.
+        return None
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return None
+
+
 def notebook_name_from_dir(dir_path: Path) -> str:
     """Extract a notebook name from a directory path."""
     return dir_path.name or "Untitled"
+
+
+def write_file(path: str | os.PathLike[str], data: bytes) -> None:
+    """Write *data* to *path*, creating or truncating the file.
+
+    Uses ``os.open``/``os.write`` directly, skipping the buffered file
+    object that ``Path.write_bytes`` would build for a single write.
+    New files get mode 0o666 filtered by the umask, as with ``open()``.
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
@@ -1,6 +1,10 @@
 """Tests for onenote_export.converter.base module."""
 
 import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from onenote_export.converter.base import (
     BaseConverter,
@@ -14,6 +18,7 @@ from onenote_export.model.content import (
 from onenote_export.model.notebook import Notebook
 from onenote_export.model.page import Page
 from onenote_export.model.section import Section
+from onenote_export.utils import write_file
 
 
 class TestSanitizeFilename:
@@ -29,6 +34,9 @@ class TestSanitizeFilename:
         assert ":" not in result
         assert '"' not in result
 
+    def test_replaces_control_chars(self):
+        assert _sanitize_filename("tab\there\x00\x1fend\x7f") == "tab here end\x7f"
+
     def test_collapses_underscores(self):
         result = _sanitize_filename("a___b")
         assert result == "a b"
@@ -36,11 +44,28 @@ class TestSanitizeFilename:
     def test_empty_returns_unnamed(self):
         assert _sanitize_filename("") == "unnamed"
 
+    def test_repeated_names_served_from_cache(self):
+        _sanitize_filename.cache_clear()
+        assert _sanitize_filename("image1.png") == "image1.png"
+        assert _sanitize_filename("image1.png") == "image1.png"
+        assert _sanitize_filename.cache_info().hits == 1
+
     def test_truncates_long_names(self):
         long_name = "a" * 300
         result = _sanitize_filename(long_name)
         assert len(result) <= 200
 
+    def test_long_names_sharing_a_prefix_stay_distinct(self):
+        first = _sanitize_filename("a" * 250 + "one")
+        second = _sanitize_filename("a" * 250 + "two")
+        assert first != second
+        assert first.startswith("a" * 180)
+        assert len(first) == len(second) == 200
+        assert _sanitize_filename("a" * 250 + "one") == first
+
+    def test_name_at_limit_is_not_hashed(self):
+        assert _sanitize_filename("a" * 200) == "a" * 200
+
 
 class TestPageFilename:
     """Tests for _page_filename with various extensions."""
@@ -69,6 +94,12 @@ class TestPageFilename:
         assert first == "Notes.html"
         assert second == "Notes (2).html"
 
+    def test_duplicates_are_case_insensitive_and_keep_counting(self):
+        seen: dict[str, int] = {}
+        names = [_page_filename(t, seen) for t in ("Notes", "notes", "NOTES")]
+        assert names == ["Notes.md", "notes (2).md", "NOTES (3).md"]
+        assert seen == {"notes.md": 3}
+
     def test_untitled_page(self):
         seen: dict[str, int] = {}
         result = _page_filename("", seen)
@@ -133,6 +164,11 @@ class TestBaseConverterConvertNotebook:
         assert (tmp_path / "My Notebook" / "Section A" / "Page 1.txt").exists()
         assert (tmp_path / "My Notebook" / "Section B" / "Page 2.txt").exists()
 
+    def test_empty_notebook_creates_no_directory(self, tmp_path):
+        converter = _StubConverter(tmp_path)
+        assert converter.convert_notebook(Notebook(name="Empty")) == []
+        assert not (tmp_path / "Empty").exists()
+
 
 class TestBaseConverterRenderPageAbstract:
     """Test that BaseConverter.render_page raises NotImplementedError."""
@@ -146,7 +182,7 @@ class TestBaseConverterRenderPageAbstract:
 
 
 class TestBaseConverterWriteImages:
-    """Tests for _write_images."""
+    """Tests for image writing in convert_section."""
 
     def test_writes_images(self, tmp_path):
         converter = _StubConverter(tmp_path)
@@ -165,9 +201,97 @@ class TestBaseConverterWriteImages:
         converter.convert_section(section)
         assert (tmp_path / "Test" / "images" / "pic.png").exists()
 
+    def test_images_dir_created_once_per_section(self, tmp_path):
+        converter = _StubConverter(tmp_path)
+        section = Section(
+            name="Test",
+            pages=[
+                Page(
+                    title=f"Page {i}",
+                    elements=[ImageElement(data=b"img", filename=f"{i}.png")],
+                )
+                for i in range(3)
+            ],
+        )
+        with patch.object(
+            Path, "mkdir", autospec=True, side_effect=Path.mkdir
+        ) as mkdir:
+            converter.convert_section(section)
+        created = [call.args[0] for call in mkdir.call_args_list]
+        assert created.count(tmp_path / "Test" / "images") == 1
+        assert len(list((tmp_path / "Test" / "images").iterdir())) == 3
+
+    def test_repeated_image_written_once(self, tmp_path):
+        converter = _StubConverter(tmp_path)
+        section = Section(
+            name="Test",
+            pages=[
+                Page(
+                    title=f"Page {i}",
+                    elements=[ImageElement(data=b"logo", filename="logo.png")],
+                )
+                for i in range(3)
+            ],
+        )
+        with patch(
+            "onenote_export.converter.base.write_file", wraps=write_file
+        ) as write:
+            created = converter.convert_section(section)
+        logo = tmp_path / "Test" / "images" / "logo.png"
+        assert created.count(logo) == 1
+        assert [call.args[0] for call in write.call_args_list].count(logo) == 1
+
+    @pytest.mark.parametrize(
+        "first",
+        [
+            pytest.param(b"old", id="same-size"),
+            pytest.param(b"o" * (1024 * 1024), id="larger-first"),
+        ],
+    )
+    def test_same_name_with_new_data_keeps_last(self, tmp_path, first):
+        converter = _StubConverter(tmp_path)
+        section = Section(
+            name="Test",
+            pages=[
+                Page(
+                    title="First",
+                    elements=[ImageElement(data=first, filename="pic.png")],
+                ),
+                Page(
+                    title="Second",
+                    elements=[ImageElement(data=b"new", filename="pic.png")],
+                ),
+            ],
+        )
+        created = converter.convert_section(section)
+        pic = tmp_path / "Test" / "images" / "pic.png"
+        assert created.count(pic) == 1
+        assert pic.read_bytes() == b"new"
+
+    def test_unnamed_images_sharing_a_path_keep_last_page(self, tmp_path):
+        converter = _StubConverter(tmp_path)
+        blobs = [b"x" * (2 * 1024 * 1024), b"small" * 2] * 3
+        section = Section(
+            name="Test",
+            pages=[
+                Page(
+                    title=f"Page {i}",
+                    elements=[ImageElement(data=data, filename="image.png")],
+                )
+                for i, data in enumerate(blobs)
+            ],
+        )
+        with patch(
+            "onenote_export.converter.base.write_file", wraps=write_file
+        ) as write:
+            converter.convert_section(section)
+        image = tmp_path / "Test" / "images" / "image.png"
+        assert image.read_bytes() == blobs[-1]
+        assert [call.args[0] for call in write.call_args_list].count(image) == 1
+
 
 class TestBaseConverterWriteEmbeddedFiles:
-    """Tests for _write_embedded_files."""
+    """Tests for attachment writing in convert_section."""
 
     def test_writes_attachments(self, tmp_path):
         converter = _StubConverter(tmp_path)
@@ -182,3 +306,58 @@ class TestBaseConverterWriteEmbeddedFiles:
         )
         converter.convert_section(section)
         assert (tmp_path / "Test" / "attachments" / "doc.pdf").exists()
+
+
+class TestBaseConverterCollectBinaries:
+    """Tests for _collect_binaries."""
+
+    def test_splits_images_and_attachments_in_one_pass(self, tmp_path):
+        converter = _StubConverter(tmp_path)
+        page = Page(
+            elements=[
+                ImageElement(data=b"a", format="png"),
+                EmbeddedFile(data=b"doc", filename="doc.pdf"),
+                ImageElement(filename="no-data.png"),
+                EmbeddedFile(filename="no-data.pdf"),
+                ImageElement(data=b"b"),
+            ]
+        )
+        images, attachments = converter._collect_binaries(page, tmp_path)
+        assert images == [
+            (tmp_path / "images" / "image 001.png", b"a"),
+            (tmp_path / "images" / "image 002.bin", b"b"),
+        ]
+        assert attachments == [(tmp_path / "attachments" / "doc.pdf", b"doc")]
+
+    def test_page_without_binaries_creates_no_directories(self, tmp_path):
+        converter = _StubConverter(tmp_path)
+        section = Section(name="Test", pages=[Page(title="Plain")])
+        converter.convert_section(section)
+        assert sorted(p.name for p in (tmp_path / "Test").iterdir()) == ["Plain.txt"]
+
+
+class TestBaseConverterCreatedOrder:
+    """convert_section reports written files in a deterministic order."""
+
+    def test_pages_then_their_images_and_attachments(self, tmp_path):
+        converter = _StubConverter(tmp_path)
+        section = Section(
+            name="Test",
+            pages=[
+                Page(
+                    title="First",
+                    elements=[
+                        EmbeddedFile(data=b"doc", filename="doc.pdf"),
+                        ImageElement(data=b"img", filename="pic.png"),
+                    ],
+                ),
+                Page(title="Second"),
+            ],
+        )
+        created = converter.convert_section(section)
+        assert [p.relative_to(tmp_path / "Test").as_posix() for p in created] == [
+            "First.txt",
+            "images/pic.png",
+            "attachments/doc.pdf",
+            "Second.txt",
+        ]
@@ -1,12 +1,17 @@
 """Tests for onenote_export.cli module."""
 
+import functools
+import io
 import logging
+import multiprocessing
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-from onenote_export.cli import main, _deduplicate_sections
+from onenote_export.cli import _parse_sections, main, _deduplicate_sections
 
 
 TEST_DATA = Path(__file__).parent / "test_data"
@@ -35,7 +40,7 @@ class TestDeduplicateSections:
         new.touch()
         result = _deduplicate_sections([old, new])
         assert len(result) == 1
-        assert result[0] == new
+        assert result[0] == (new, "ADI")
 
     def test_dotone_date_pattern(self, tmp_path):
         old = tmp_path / "ADP.one (On 8-24-22).one"
@@ -44,14 +49,14 @@ class TestDeduplicateSections:
         new.touch()
         result = _deduplicate_sections([old, new])
         assert len(result) == 1
-        assert result[0] == new
+        assert result[0] == (new, "ADP")
 
     def test_undated_file_kept_when_no_dated_version(self, tmp_path):
         f = tmp_path / "Notes.one"
         f.touch()
         result = _deduplicate_sections([f])
         assert len(result) == 1
-        assert result[0] == f
+        assert result[0] == (f, "Notes")
 
     def test_dated_wins_over_undated(self, tmp_path):
         undated = tmp_path / "Notes.one"
@@ -60,7 +65,7 @@ class TestDeduplicateSections:
         dated.touch()
         result = _deduplicate_sections([undated, dated])
         assert len(result) == 1
-        assert result[0] == dated
+        assert result[0] == (dated, "Notes")
 
     def test_empty_list(self):
         assert _deduplicate_sections([]) == []
@@ -72,7 +77,7 @@ class TestDeduplicateSections:
         new.touch()
         result = _deduplicate_sections([old, new])
         assert len(result) == 1
-        assert result[0] == new
+        assert result[0] == (new, "Test")
 
 
 @pytest.mark.skipif(not _HAS_TEST_DATA, reason="test_data not available")
@@ -142,6 +147,28 @@ class TestMainHappyPath:
         assert len(html_files) >= 1
         assert len(md_files) >= 1
 
+    def test_serial_and_parallel_output_match(self, tmp_path):
+        """--jobs 1 and --jobs 2 produce identical files."""
+        serial = tmp_path / "serial"
+        parallel = tmp_path / "parallel"
+        assert main(["-i", str(NOTEBOOK_DIR), "-o", str(serial), "-j", "1"]) == 0
+        assert main(["-i", str(NOTEBOOK_DIR), "-o", str(parallel), "-j", "2"]) == 0
+        serial_files = sorted(p.relative_to(serial) for p in serial.rglob("*.md"))
+        parallel_files = sorted(p.relative_to(parallel) for p in parallel.rglob("*.md"))
+        assert serial_files == parallel_files
+        for rel in serial_files:
+            assert (serial / rel).read_bytes() == (parallel / rel).read_bytes()
+
+    def test_progress_written_once_per_notebook(self, tmp_path):
+        """Per-section progress lines are flushed together per notebook."""
+        with patch("onenote_export.cli._write_report") as write_report:
+            assert main(["-i", str(NOTEBOOK_DIR), "-o", str(tmp_path / "out")]) == 0
+        write_report.assert_called_once()
+        (lines,) = write_report.call_args.args
+        assert lines[0] == "\nProcessing notebook: Example-NoteBook-1"
+        assert any(line.startswith("  Section: ") for line in lines[1:])
+        assert any(line.endswith("page(s) extracted") for line in lines[1:])
+
     def test_default_format_is_markdown(self, tmp_path):
         """Default format produces only .md files."""
         result = main(["-i", str(NOTEBOOK_DIR), "-o", str(tmp_path / "default_out")])
@@ -204,6 +231,105 @@ class TestMainErrorHandling:
             assert result in (0, 2)
 
 
+class TestProgressOutput:
+    """Tests for how progress lines and errors are interleaved."""
+
+    def test_parse_error_follows_its_section_line(self, tmp_path, monkeypatch):
+        """Progress is flushed before an error, so the two stay in order."""
+        bad_dir = tmp_path / "bad_notebook"
+        bad_dir.mkdir()
+        (bad_dir / "bad.one").write_bytes(b"not a real onenote file")
+        output = io.StringIO()
+        monkeypatch.setattr(sys, "stdout", output)
+        monkeypatch.setattr(sys, "stderr", output)
+
+        main(["-i", str(bad_dir), "-o", str(tmp_path / "out"), "-j", "1"])
+        lines = output.getvalue().splitlines()
+        section = lines.index("  Section: bad (bad.one)")
+        error = next(i for i, line in enumerate(lines) if "ERROR: bad.one" in line)
+        assert lines[section - 1] == "Processing notebook: bad_notebook"
+        assert error == section + 1
+
+
+class TestJobsArgument:
+    """Tests for --jobs argument parsing (no test data required)."""
+
+    @pytest.mark.parametrize("value", ["0", "-2", "many"])
+    def test_invalid_jobs_rejected(self, tmp_path, value):
+        with pytest.raises(SystemExit) as exc_info:
+            main(["-i", str(tmp_path), "-o", str(tmp_path / "out"), "-j", value])
+        assert exc_info.value.code == 2
+
+    def test_parse_error_collected_serially(self, tmp_path):
+        """A bad file is reported without a worker pool as well."""
+        bad_dir = tmp_path / "bad_notebook"
+        bad_dir.mkdir()
+        (bad_dir / "bad.one").write_bytes(b"not a real onenote file")
+
+        result = main(["-i", str(bad_dir), "-o", str(tmp_path / "out"), "-j", "1"])
+        assert result == 2
+
+
+class TestParseSections:
+    """Tests for the per-section loaders used to parse without a pool."""
+
+    def test_serial_loader_parses_when_called(self):
+        with patch("onenote_export.cli._parse_section") as parse:
+            parse.side_effect = lambda path: f"parsed {path}"
+            loaders = _parse_sections([Path("a.one"), Path("b.one")], jobs=1)
+            first = next(loaders)
+            parse.assert_not_called()
+            assert first() == "parsed a.one"
+            assert next(loaders)() == "parsed b.one"
+            assert next(loaders, None) is None
+        assert [call.args[0] for call in parse.call_args_list] == [
+            Path("a.one"),
+            Path("b.one"),
+        ]
+
+    def test_serial_loader_raises_parse_error(self):
+        with patch("onenote_export.cli._parse_section", side_effect=ValueError("bad")):
+            (load,) = _parse_sections([Path("a.one")], jobs=4)
+            with pytest.raises(ValueError, match="bad"):
+                load()
+
+
+class _RecordingPool:
+    """Stand-in for ProcessPoolExecutor that completes tasks on submit."""
+
+    last: "_RecordingPool | None" = None
+
+    def __init__(self, max_workers, initializer=None, initargs=()):
+        self.submitted: list[Path] = []
+        _RecordingPool.last = self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def submit(self, fn, section_file):
+        self.submitted.append(section_file)
+        future = Future()
+        future.set_result(section_file)
+        return future
+
+
+class TestParseSectionsWindow:
+    """The pool path keeps a bounded number of sections in flight."""
+
+    def test_submits_at_most_two_per_worker_ahead(self):
+        files = [Path(f"{i}.one") for i in range(10)]
+        with patch("onenote_export.cli.ProcessPoolExecutor", _RecordingPool):
+            loaders = _parse_sections(files, jobs=2)
+            first = next(loaders)
+            assert len(_RecordingPool.last.submitted) == 5
+            assert first() == files[0]
+            assert [load() for load in loaders] == files[1:]
+        assert _RecordingPool.last.submitted == files
+
+
 class TestFormatArgument:
     """Tests for --format argument parsing (no test data required)."""
 
@@ -267,6 +393,26 @@ class TestMainLogging:
             call_kwargs = mock_config.call_args[1]
             assert call_kwargs["level"] == logging.DEBUG
 
+    def test_worker_logs_reach_stderr_under_debug(self, tmp_path, capfd):
+        """Spawned parser workers log at the level chosen by --debug."""
+        spawn_pool = functools.partial(
+            ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")
+        )
+        with patch("onenote_export.cli.ProcessPoolExecutor", spawn_pool):
+            main(
+                [
+                    "-i",
+                    str(NOTEBOOK_DIR),
+                    "-o",
+                    str(tmp_path / "out"),
+                    "--debug",
+                    "-j",
+                    "2",
+                ]
+            )
+        err = capfd.readouterr().err
+        assert "DEBUG: Parsing " in err
+
     def test_default_warning_level(self, tmp_path):
         """Default log level is WARNING."""
         with patch("onenote_export.cli.logging.basicConfig") as mock_config:
@@ -1,24 +1,30 @@
 """Tests for onenote_export.parser.content_extractor module."""
 
+import sys
+
 from onenote_export.parser.content_extractor import (
     _as_bool,
-    _build_top_level_oe_ids,
+    _child_ids,
     _clean_text,
     _decode_text_value,
     _deduplicate_objects,
     _dedup_elements,
     _detect_image_format,
     _extract_rich_text,
+    _heading_levels,
+    _is_hex,
     _looks_garbled,
     _parse_byte_prop_as_int,
-    _parse_font_size,
     _parse_hyperlink_field_codes,
-    _parse_int_prop,
+    _prescan,
     _reorder_by_outline_hierarchy,
-    _section_name_from_path,
+    _resolve_heading_level,
+    _text_style,
+    _TextStyle,
 )
 from onenote_export.model.content import RichText, TextRun
 from onenote_export.parser.one_store import ExtractedObject
+from onenote_export.utils import bytes_from_repr
 
 
 class TestDecodeTextValue:
@@ -53,6 +59,23 @@ class TestDecodeTextValue:
         result = _decode_text_value("Hello\x00World")
         assert "\x00" not in result
 
+    def test_odd_length_hex_kept_as_text(self):
+        assert _decode_text_value("abc", encoding="ascii") == "abc"
+
+
+class TestIsHex:
+    """Tests for _is_hex."""
+
+    def test_hex_digits(self):
+        assert _is_hex("0123456789abcdefABCDEF")
+
+    def test_non_hex_ascii(self):
+        assert not _is_hex("48656c6c6g")
+
+    def test_non_ascii_rejected(self):
+        assert not _is_hex("00\u00e9f")
+        assert not _is_hex("\uff10\uff11")
+
 
 class TestLooksGarbled:
     """Tests for _looks_garbled."""
@@ -71,6 +94,12 @@ class TestLooksGarbled:
         garbled = "\u4e48\u5f00\u53d1"
         assert _looks_garbled(garbled) is True
 
+    def test_latin1_text_not_garbled(self):
+        assert _looks_garbled("caf\u00e9 na\u00efve") is False
+
+    def test_mostly_latin_text_with_few_cjk(self):
+        assert _looks_garbled("Hello \u4e16\u754c") is False
+
 
 class TestCleanText:
     """Tests for _clean_text."""
@@ -84,6 +113,9 @@ class TestCleanText:
     def test_empty_string(self):
         assert _clean_text("") == ""
 
+    def test_removes_artifacts_and_normalizes_spaces(self):
+        assert _clean_text("a\x0bb\ufffd\u202fc ") == "ab c"
+
 
 class TestAsBool:
     """Tests for _as_bool."""
@@ -112,45 +144,15 @@ class TestAsBool:
     def test_none(self):
         assert _as_bool(None) is False
 
+    def test_string_case_insensitive(self):
+        assert _as_bool("YES") is True
+        assert _as_bool("False") is False
 
-class TestParseIntProp:
-    """Tests for _parse_int_prop."""
-
-    def test_int_value(self):
-        assert _parse_int_prop(42) == 42
-
-    def test_zero(self):
-        assert _parse_int_prop(0) == 0
-
-    def test_bytes_value(self):
-        raw = (100).to_bytes(4, "little")
-        assert _parse_int_prop(raw) == 100
+    def test_str_subclass(self):
+        class Flag(str):
+            pass
 
-    def test_string_with_number(self):
-        assert _parse_int_prop("size: 12pt") == 12
-
-    def test_string_no_number(self):
-        assert _parse_int_prop("none") == 0
-
-    def test_none(self):
-        assert _parse_int_prop(None) == 0
-
-
-class TestParseFontSize:
-    """Tests for _parse_font_size."""
-
-    def test_int_value(self):
-        assert _parse_font_size(11) == 11
-
-    def test_bytes_value(self):
-        raw = (14).to_bytes(2, "little")
-        assert _parse_font_size(raw) == 14
-
-    def test_string_value(self):
-        assert _parse_font_size("12") == 12
-
-    def test_zero(self):
-        assert _parse_font_size(0) == 0
+        assert _as_bool(Flag("TRUE")) is True
 
 
 class TestDetectImageFormat:
@@ -180,6 +182,10 @@ class TestDetectImageFormat:
         data = b"RIFF\x00\x00\x00\x00WEBP" + b"\x00" * 100
         assert _detect_image_format(data) == "webp"
 
+    def test_riff_non_webp(self):
+        data = b"RIFF\x00\x00\x00\x00WAVE" + b"\x00" * 100
+        assert _detect_image_format(data) == ""
+
     def test_unknown_format(self):
         data = b"\x00\x01\x02\x03" + b"\x00" * 100
         assert _detect_image_format(data) == ""
@@ -191,6 +197,41 @@ class TestDetectImageFormat:
         assert _detect_image_format(b"\x89PN") == ""
 
 
+class TestHeadingLevels:
+    """Tests for _heading_levels and _resolve_heading_level."""
+
+    def test_keeps_only_heading_styles(self):
+        styles = {"<id-1>": "h1", "<id-2>": "p", "<id-3>": "h3"}
+        assert _heading_levels(styles) == {"<id-1>": 1, "<id-3>": 3}
+
+    def test_no_styles(self):
+        assert _heading_levels(None) == {}
+        assert _heading_levels({}) == {}
+
+    def test_resolves_first_paragraph_style_ref(self):
+        levels = {"<id-2>": 2}
+        assert _resolve_heading_level({"ParagraphStyle": ["<id-2>"]}, levels) == 2
+        assert _resolve_heading_level({"ParagraphStyle": ["<id-9>"]}, levels) == 0
+        assert _resolve_heading_level({}, levels) == 0
+
+
+class TestTextStyle:
+    """Tests for _text_style."""
+
+    def test_empty_container_matches_default(self):
+        assert _text_style({}) == _TextStyle()
+
+    def test_resolves_formatting(self):
+        style = _text_style(
+            {"Bold": "true", "Underline": 1, "Font": "Calibri\x00", "FontSize": 22}
+        )
+        assert style.bold is True
+        assert style.underline is True
+        assert style.italic is False
+        assert style.font == "Calibri"
+        assert style.font_size == 22
+
+
 class TestDeduplicateObjects:
     """Tests for _deduplicate_objects."""
 
@@ -263,12 +304,60 @@ class TestDeduplicateObjects:
         result = _deduplicate_objects(objs)
         assert len(result) == 2
 
+    def test_image_fields_not_confused_by_separators(self):
+        """Filename/alt text pairs that concatenate alike stay distinct."""
+
+        def image(identity, filename, alt):
+            return ExtractedObject(
+                obj_type="jcidImageNode",
+                identity=identity,
+                properties={"ImageFilename": filename, "ImageAltText": alt},
+            )
+
+        objs = [
+            image("1", "a:b", "c"),
+            image("2", "a", "b:c"),
+            image("3", "a:b", "c"),
+            image("4", "a", "b:c"),
+        ]
+        result = _deduplicate_objects(objs)
+        assert [o.identity for o in result] == ["1", "2"]
+
     def test_empty_list(self):
         assert _deduplicate_objects([]) == []
 
+    def test_fills_text_cache(self):
+        objs = [
+            ExtractedObject(
+                obj_type="jcidRichTextOENode",
+                identity=str(i),
+                properties={"RichEditTextUnicode": text},
+            )
+            for i, text in enumerate(["Hello", "World", "Hello", "World"])
+        ]
+        text_cache: dict[int, str] = {}
+        _deduplicate_objects(objs, text_cache)
+        assert text_cache == {id(o): o.properties["RichEditTextUnicode"] for o in objs}
+
+
+class TestChildIds:
+    """Tests for _child_ids."""
+
+    def test_string_ref_is_one_child(self):
+        obj = ExtractedObject(
+            obj_type="jcidOutlineNode",
+            identity="outline-1",
+            properties={"ElementChildNodesOfVersionHistory": "oe-1"},
+        )
+        assert _child_ids(obj) == ["oe-1"]
+
+    def test_missing_property(self):
+        obj = ExtractedObject(obj_type="jcidOutlineNode", identity="outline-1")
+        assert _child_ids(obj) == []
+
 
-class TestBuildTopLevelOeIds:
-    """Tests for _build_top_level_oe_ids."""
+class TestPrescanTopLevelOeIds:
+    """Tests for the top-level OE ids collected by _prescan."""
 
     def test_collects_outline_node_children(self):
         objs = [
@@ -278,7 +367,7 @@ class TestBuildTopLevelOeIds:
                 properties={"ElementChildNodesOfVersionHistory": ["oe-1", "oe-2"]},
             ),
         ]
-        result = _build_top_level_oe_ids(objs)
+        result = _prescan(objs).top_level_oe_ids
         assert result == {"oe-1", "oe-2"}
 
     def test_string_ref_normalized_to_list(self):
@@ -290,14 +379,14 @@ class TestBuildTopLevelOeIds:
                 properties={"ElementChildNodesOfVersionHistory": "oe-single"},
             ),
         ]
-        result = _build_top_level_oe_ids(objs)
+        result = _prescan(objs).top_level_oe_ids
         assert result == {"oe-single"}
 
     def test_no_outline_nodes(self):
         objs = [
             ExtractedObject(obj_type="jcidRichTextOENode", identity="1"),
         ]
-        result = _build_top_level_oe_ids(objs)
+        result = _prescan(objs).top_level_oe_ids
         assert result == set()
 
     def test_empty_refs(self):
@@ -308,10 +397,51 @@ class TestBuildTopLevelOeIds:
                 properties={"ElementChildNodesOfVersionHistory": []},
             ),
         ]
-        result = _build_top_level_oe_ids(objs)
+        result = _prescan(objs).top_level_oe_ids
         assert result == set()
 
 
+class TestPrescan:
+    """Tests for the remaining lookups collected by _prescan."""
+
+    def test_identity_map_and_list_nodes(self):
+        objs = [
+            ExtractedObject(obj_type="jcidOutlineElementNode", identity="oe-1"),
+            ExtractedObject(
+                obj_type="jcidNumberListNode",
+                identity="list-1",
+                properties={"NumberListFormat": "x"},
+            ),
+            ExtractedObject(obj_type="jcidRichTextOENode", identity=""),
+        ]
+        index = _prescan(objs)
+        assert index.identity_map == {"oe-1": 0, "list-1": 1}
+        assert index.list_node_map == {"list-1": {"NumberListFormat": "x"}}
+
+    def test_out_of_line_cell_content(self):
+        """Content referenced by a cell but stored before the table is skipped."""
+        objs = [
+            ExtractedObject(obj_type="jcidOutlineElementNode", identity="moved"),
+            ExtractedObject(obj_type="jcidRichTextOENode", identity="moved-text"),
+            ExtractedObject(obj_type="jcidOutlineNode", identity="outline"),
+            ExtractedObject(obj_type="jcidTableNode", identity="table"),
+            ExtractedObject(obj_type="jcidTableRowNode", identity="row"),
+            ExtractedObject(
+                obj_type="jcidTableCellNode",
+                identity="cell-1",
+                properties={"ElementChildNodesOfVersionHistory": ["moved"]},
+            ),
+            ExtractedObject(
+                obj_type="jcidTableCellNode",
+                identity="cell-2",
+                properties={"ElementChildNodesOfVersionHistory": ["inline"]},
+            ),
+            ExtractedObject(obj_type="jcidOutlineElementNode", identity="inline"),
+            ExtractedObject(obj_type="jcidRichTextOENode", identity="inline-text"),
+        ]
+        assert _prescan(objs).out_of_line == {0, 1}
+
+
 class TestDecodeTextEdgeCases:
     """Additional edge case tests for _decode_text_value."""
 
@@ -378,42 +508,15 @@ class TestParseBytePropAsInt:
         """Single byte should return 0 (need at least 2)."""
         assert _parse_byte_prop_as_int(b"\x05") == 0
 
+    def test_repr_string_parsed_once(self):
+        bytes_from_repr.cache_clear()
+        for _ in range(3):
+            assert _parse_byte_prop_as_int("b'5\\x00'") == 53
+        info = bytes_from_repr.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
 
-class TestSectionNameFromPath:
-    """Tests for _section_name_from_path."""
-
-    def test_simple_filename(self):
-        assert _section_name_from_path("/path/to/Notes.one") == "Notes"
-
-    def test_filename_with_date(self):
-        result = _section_name_from_path("/path/to/ADI (On 2-25-26).one")
-        assert result == "ADI"
-
-    def test_filename_with_date_dash_suffix(self):
-        result = _section_name_from_path("/path/to/Section (On 2-25-26 - 3).one")
-        assert result == "Section"
-
-    def test_empty_after_cleaning(self):
-        """If name becomes empty after cleaning, return 'Untitled'."""
-        result = _section_name_from_path("/path/to/.one")
-        assert result == "Untitled"
-
-
-class TestParseFontSizeEdgeCases:
-    """Additional edge case tests for _parse_font_size."""
-
-    def test_none_value(self):
-        assert _parse_font_size(None) == 0
-
-    def test_string_no_number(self):
-        assert _parse_font_size("normal") == 0
-
-    def test_single_byte(self):
-        raw = b"\x0e"  # 14
-        assert _parse_font_size(raw) == 14
-
-    def test_empty_bytes(self):
-        assert _parse_font_size(b"") == 0
+    def test_non_bytes_literal(self):
+        assert _parse_byte_prop_as_int("b'' + 1") == 0
 
 
 class TestDedupElements:
@@ -426,6 +529,12 @@ class TestDedupElements:
         result = _dedup_elements([elem1, elem2])
         assert len(result) == 1
 
+    def test_key_ignores_run_boundaries_and_outer_whitespace(self):
+        single = RichText(runs=[TextRun(text="Hello world ")])
+        split = RichText(runs=[TextRun(text="Hello"), TextRun(text="world")])
+        result = _dedup_elements([single, split])
+        assert result == [single]
+
     def test_keeps_same_text_different_list_type(self):
         """Same text in different list types is not a duplicate."""
         run = TextRun(text="Item")
@@ -447,7 +556,7 @@ class TestExtractRichText:
             identity="1",
             properties={},
         )
-        result = _extract_rich_text(obj, {}, None)
+        result = _extract_rich_text(obj, _TextStyle(), None)
         assert result is None
 
     def test_returns_none_for_whitespace_only(self):
@@ -456,7 +565,7 @@ class TestExtractRichText:
             identity="1",
             properties={"RichEditTextUnicode": "   "},
         )
-        result = _extract_rich_text(obj, {}, None)
+        result = _extract_rich_text(obj, _TextStyle(), None)
         assert result is None
 
     def test_extracts_text_with_formatting(self):
@@ -465,20 +574,55 @@ class TestExtractRichText:
             identity="1",
             properties={"RichEditTextUnicode": "Hello"},
         )
-        style = {"Bold": True, "Italic": True}
+        style = _text_style({"Bold": True, "Italic": True})
         result = _extract_rich_text(obj, style, None)
         assert result is not None
         assert result.runs[0].text == "Hello"
         assert result.runs[0].bold is True
         assert result.runs[0].italic is True
 
+    def test_hyperlink_url_cleaned(self):
+        obj = ExtractedObject(
+            obj_type="jcidRichTextOENode",
+            identity="1",
+            properties={
+                "RichEditTextUnicode": "Link",
+                "WzHyperlinkUrl": " https://x.test\x00 ",
+            },
+        )
+        result = _extract_rich_text(obj, _TextStyle(), None)
+        assert result is not None
+        assert result.runs[0].hyperlink_url == "https://x.test"
+
+    def test_no_hyperlink_url(self):
+        obj = ExtractedObject(
+            obj_type="jcidRichTextOENode",
+            identity="1",
+            properties={"RichEditTextUnicode": "Plain"},
+        )
+        result = _extract_rich_text(obj, _TextStyle(), None)
+        assert result is not None
+        assert result.runs[0].hyperlink_url == ""
+
+    def test_uses_cached_decoded_text(self):
+        obj = ExtractedObject(
+            obj_type="jcidRichTextOENode",
+            identity="1",
+            properties={"RichEditTextUnicode": "raw"},
+        )
+        result = _extract_rich_text(
+            obj, _TextStyle(), None, text_cache={id(obj): "cached"}
+        )
+        assert result is not None
+        assert result.runs[0].text == "cached"
+
     def test_extracts_text_from_ascii(self):
         obj = ExtractedObject(
             obj_type="jcidRichTextOENode",
             identity="1",
             properties={"TextExtendedAscii": "World"},
         )
-        result = _extract_rich_text(obj, {}, None)
+        result = _extract_rich_text(obj, _TextStyle(), None)
         assert result is not None
         assert result.runs[0].text == "World"
 
@@ -494,7 +638,7 @@ class TestExtractRichText:
                 ),
             },
         )
-        result = _extract_rich_text(obj, {}, None)
+        result = _extract_rich_text(obj, _TextStyle(), None)
         assert result is not None
         assert result.runs[0].text == "User Name (Accepted)"
         assert result.runs[0].hyperlink_url == "mailto:user@example.com"
@@ -511,7 +655,7 @@ class TestExtractRichText:
                 ),
             },
         )
-        result = _extract_rich_text(obj, {}, None)
+        result = _extract_rich_text(obj, _TextStyle(), None)
         assert result is not None
         assert result.runs[0].text == "Link to Document"
         assert result.runs[0].hyperlink_url == "https://example.com/path"
@@ -552,6 +696,11 @@ class TestParseHyperlinkFieldCodes:
         segments = _parse_hyperlink_field_codes("")
         assert segments == [("", "")]
 
+    def test_vertical_tab_after_hyperlink_keyword(self):
+        text = 'see \uFDDFHYPERLINK\x0b"http://x"Link'
+        segments = _parse_hyperlink_field_codes(text)
+        assert segments == [("see", ""), ("Link", "http://x")]
+
     def test_mixed_text_and_field_code(self):
         """Text with prefix before a field code produces two segments."""
         text = 'Meeting options | \uFDDFHYPERLINK "https://example.com"Reset PIN'
@@ -572,6 +721,11 @@ class TestParseHyperlinkFieldCodes:
         assert segments[1] == ("Link A |", "https://a.com")
         assert segments[2] == ("Link B", "https://b.com")
 
+    def test_bare_marker_without_hyperlink_kept_as_text(self):
+        text = "before \uFDDF after"
+        segments = _parse_hyperlink_field_codes(text)
+        assert segments == [("before \uFDDF after", "")]
+
 
 class TestDecodeGarbledUnicode:
     """Tests for garbled text detection in Unicode encoding path."""
@@ -733,3 +887,26 @@ class TestReorderByOutlineHierarchy:
 
         # Title node (no vert) should come before body node (vert=200)
         assert identities.index("ON-title") < identities.index("ON-body")
+
+    def test_deeply_nested_outline(self):
+        """Nesting deeper than the recursion limit is walked in order."""
+        depth = sys.getrecursionlimit() + 100
+        objs = [
+            self._make_obj("jcidRichTextOENode", "orphan", RichEditTextUnicode="x"),
+            self._make_obj(
+                "jcidOutlineNode", "ON", ElementChildNodesOfVersionHistory=["OE0"]
+            ),
+        ]
+        objs += [
+            self._make_obj(
+                "jcidOutlineElementNode",
+                f"OE{d}",
+                ElementChildNodesOfVersionHistory=[f"OE{d + 1}"],
+            )
+            for d in range(depth)
+        ]
+        objs.append(self._make_obj("jcidOutlineElementNode", f"OE{depth}"))
+        result = _reorder_by_outline_hierarchy(objs)
+        assert [o.identity for o in result] == (
+            ["ON"] + [f"OE{d}" for d in range(depth + 1)] + ["orphan"]
+        )
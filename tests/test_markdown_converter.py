@@ -1,9 +1,11 @@
 """Tests for onenote_export.converter.markdown module."""
 
 import tempfile
+from unittest.mock import patch
 
 from onenote_export.converter.markdown import MarkdownConverter
 from onenote_export.model.content import (
+    ContentElement,
     EmbeddedFile,
     ImageElement,
     RichText,
@@ -86,6 +88,29 @@ class TestMarkdownConverterRenderPage:
         result = self.converter.render_page(page)
         assert "[click here](https://example.com)" in result
 
+    def test_mixed_plain_and_formatted_runs(self):
+        page = Page(
+            elements=[
+                RichText(
+                    runs=[
+                        TextRun(text="plain "),
+                        TextRun(text="bold", bold=True),
+                        TextRun(text=""),
+                        TextRun(text=" tail"),
+                    ]
+                )
+            ],
+        )
+        assert self.converter.render_page(page) == "plain **bold** tail\n"
+
+    def test_heading_drops_run_formatting(self):
+        page = Page(
+            elements=[
+                RichText(runs=[TextRun(text="Title", bold=True)], heading_level=2)
+            ],
+        )
+        assert self.converter.render_page(page) == "## Title\n"
+
     def test_page_with_superscript(self):
         page = Page(
             title="Test",
@@ -102,6 +127,30 @@ class TestMarkdownConverterRenderPage:
         result = self.converter.render_page(page)
         assert "<sub>2</sub>" in result
 
+    def test_all_formatting_nests_in_fixed_order(self):
+        run = TextRun(
+            text="x",
+            bold=True,
+            italic=True,
+            underline=True,
+            strikethrough=True,
+            superscript=True,
+            subscript=True,
+        )
+        page = Page(elements=[RichText(runs=[run])])
+        assert self.converter.render_page(page) == (
+            "<sub><sup>****~~x~~****</sup></sub>\n"
+        )
+
+    def test_hyperlink_keeps_only_script_formatting(self):
+        run = TextRun(
+            text="note", hyperlink_url="https://x.test", bold=True, superscript=True
+        )
+        page = Page(elements=[RichText(runs=[run])])
+        assert self.converter.render_page(page) == (
+            "<sup>[note](https://x.test)</sup>\n"
+        )
+
     def test_page_with_indented_text(self):
         page = Page(
             title="Test",
@@ -157,6 +206,54 @@ class TestMarkdownConverterRenderPage:
         result = self.converter.render_page(page)
         assert result.strip() == ""
 
+    def test_empty_page_renders_nothing(self):
+        assert self.converter.render_page(Page()) == ""
+
+    def test_ordered_list_numbering(self):
+        def item(text, level=0, list_type="ordered"):
+            return RichText(
+                runs=[TextRun(text=text)], list_type=list_type, indent_level=level
+            )
+
+        page = Page(
+            elements=[
+                item("one"),
+                item("one-a", level=1),
+                item("bullet", level=1, list_type="unordered"),
+                item("one-b", level=1),
+                item("two"),
+                RichText(runs=[TextRun(text="paragraph")]),
+                item("restart"),
+            ]
+        )
+        lines = [line for line in self.converter.render_page(page).splitlines() if line]
+        assert lines == [
+            "1. one",
+            "   1. one-a",
+            "   - bullet",
+            "   2. one-b",
+            "2. two",
+            "paragraph",
+            "1. restart",
+        ]
+
+    def test_unknown_element_type_renders_nothing(self):
+        page = Page(elements=[ContentElement()])
+        assert self.converter.render_page(page) == ""
+
+    def test_blocks_separated_by_blank_lines(self):
+        page = Page(
+            title="Test",
+            author="Jane",
+            elements=[
+                RichText(runs=[TextRun(text="First")]),
+                RichText(runs=[TextRun(text="")]),
+                RichText(runs=[TextRun(text="Second")]),
+            ],
+        )
+        result = self.converter.render_page(page)
+        assert result == "# Test\n\nFirst\n\nSecond\n\n---\n*Author: Jane*\n"
+
 
 class TestMarkdownConverterRenderTable:
     """Tests for table rendering."""
@@ -187,6 +284,28 @@ class TestMarkdownConverterRenderTable:
         result = self.converter._render_table(table)
         assert result == ""
 
+    def test_cell_elements_rendered_once_and_blank_ones_dropped(self):
+        table = TableElement(
+            rows=[
+                [
+                    [
+                        RichText(runs=[TextRun(text="A")]),
+                        RichText(runs=[TextRun(text="")]),
+                        RichText(runs=[TextRun(text="B")]),
+                    ],
+                    [RichText(runs=[TextRun(text="")])],
+                ],
+            ]
+        )
+        with patch.object(
+            self.converter,
+            "_render_element",
+            wraps=self.converter._render_element,
+        ) as render:
+            result = self.converter._render_table(table)
+        assert render.call_count == 4
+        assert result.splitlines()[0] == "| A B |   |"
+
 
 class TestMarkdownConverterWriteFiles:
     """Tests for file writing operations."""
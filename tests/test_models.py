@@ -1,6 +1,16 @@
 """Tests for onenote_export.model module."""
 
+import pickle
+
+import pytest
+
 from onenote_export.model.content import (
+    FLAG_BOLD,
+    FLAG_ITALIC,
+    FLAG_STRIKETHROUGH,
+    FLAG_SUBSCRIPT,
+    FLAG_SUPERSCRIPT,
+    FLAG_UNDERLINE,
     EmbeddedFile,
     ImageElement,
     RichText,
@@ -42,6 +52,27 @@ class TestTextRun:
         assert run.italic is True
         assert run.strikethrough is True
 
+    def test_flags_bitmask_derived_from_fields(self):
+        assert TextRun(text="plain").flags == 0
+        run = TextRun(text="x", bold=True, underline=True, subscript=True)
+        assert run.flags == FLAG_BOLD | FLAG_UNDERLINE | FLAG_SUBSCRIPT
+        run = TextRun(text="x", italic=True, strikethrough=True, superscript=True)
+        assert run.flags == FLAG_ITALIC | FLAG_STRIKETHROUGH | FLAG_SUPERSCRIPT
+
+    def test_flags_not_a_constructor_argument(self):
+        with pytest.raises(TypeError):
+            TextRun(text="x", flags=FLAG_BOLD)
+
+    def test_uses_slots(self):
+        run = TextRun(text="hello")
+        assert not hasattr(run, "__dict__")
+
+    def test_pickle_round_trip(self):
+        run = TextRun(text="hello", bold=True, hyperlink_url="https://example.com")
+        restored = pickle.loads(pickle.dumps(run))
+        assert restored == run
+        assert restored.flags == FLAG_BOLD
+
 
 class TestRichText:
     """Tests for RichText dataclass."""
@@ -59,6 +90,26 @@ class TestRichText:
         assert len(rt.runs) == 2
         assert rt.indent_level == 1
 
+    def test_is_plain_with_unformatted_runs(self):
+        rt = RichText(runs=[TextRun(text="a"), TextRun(text="b")])
+        assert rt.is_plain
+
+    def test_is_plain_false_with_formatted_run(self):
+        rt = RichText(runs=[TextRun(text="a"), TextRun(text="b", italic=True)])
+        assert not rt.is_plain
+
+    def test_is_plain_false_with_hyperlink_run(self):
+        rt = RichText(runs=[TextRun(text="a", hyperlink_url="https://x.test")])
+        assert not rt.is_plain
+
+    def test_heading_is_plain_ignores_formatting_but_not_links(self):
+        bold = RichText(runs=[TextRun(text="a", bold=True)], heading_level=1)
+        linked = RichText(
+            runs=[TextRun(text="a", hyperlink_url="https://x.test")], heading_level=1
+        )
+        assert bold.is_plain
+        assert not linked.is_plain
+
 
 class TestImageElement:
     """Tests for ImageElement dataclass."""
@@ -138,3 +189,23 @@ class TestNotebook:
         sections = [Section(name="S1"), Section(name="S2")]
         nb = Notebook(name="My Notebook", sections=sections)
         assert len(nb.sections) == 2
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        RichText(),
+        ImageElement(),
+        TableElement(),
+        EmbeddedFile(),
+        Page(),
+        Section(),
+        Notebook(),
+    ],
+    ids=lambda obj: type(obj).__name__,
+)
+def test_models_use_slots(instance):
+    """Model instances carry no per-instance __dict__."""
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.not_a_field = 1
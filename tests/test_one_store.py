@@ -1,12 +1,15 @@
 """Tests for onenote_export.parser.one_store module."""
 
+import pickle
+
 from onenote_export.parser.one_store import (
     ExtractedObject,
     ExtractedPage,
     ExtractedSection,
+    OneStoreParser,
     _clean_text,
     _extract_guid,
-    _parse_int,
+    _normalize_child_refs,
 )
 
 
@@ -54,37 +57,21 @@ class TestCleanText:
         assert _clean_text("  test\x00data  ") == "testdata"
 
 
-class TestParseInt:
-    """Tests for _parse_int."""
-
-    def test_int_value(self):
-        assert _parse_int(42) == 42
-
-    def test_zero(self):
-        assert _parse_int(0) == 0
-
-    def test_bytes_value(self):
-        raw = (100).to_bytes(4, "little")
-        assert _parse_int(raw) == 100
-
-    def test_bytes_short(self):
-        raw = (5).to_bytes(2, "little")
-        assert _parse_int(raw) == 5
+class TestNormalizeChildRefs:
+    """Tests for _normalize_child_refs."""
 
-    def test_string_with_number(self):
-        assert _parse_int("level: 3") == 3
+    def test_list_kept(self):
+        assert _normalize_child_refs(["oe-1", "oe-2"]) == ["oe-1", "oe-2"]
 
-    def test_string_no_number(self):
-        assert _parse_int("none") == 0
+    def test_string_ref_normalized_to_list(self):
+        assert _normalize_child_refs("oe-single") == ["oe-single"]
 
-    def test_none(self):
-        assert _parse_int(None) == 0
+    def test_non_string_entries_dropped(self):
+        assert _normalize_child_refs(["oe-1", 7, None, "oe-2"]) == ["oe-1", "oe-2"]
 
-    def test_empty_string(self):
-        assert _parse_int("") == 0
-
-    def test_negative_int(self):
-        assert _parse_int(-1) == -1
+    def test_unexpected_type_yields_empty_list(self):
+        assert _normalize_child_refs(b"oe-1") == []
+        assert _normalize_child_refs(None) == []
 
 
 class TestExtractedDataclasses:
@@ -96,6 +83,31 @@ class TestExtractedDataclasses:
         assert obj.identity == "id-1"
         assert obj.properties == {}
 
+    def test_extracted_object_guid_from_identity(self):
+        obj = ExtractedObject(obj_type="test", identity="<ExtendedGUID> (g-1, 7)")
+        assert obj.guid == "g-1"
+        assert ExtractedObject(obj_type="test", identity="").guid == ""
+
+    def test_extracted_object_normalizes_child_refs(self):
+        props = {"ElementChildNodesOfVersionHistory": "oe-1"}
+        obj = ExtractedObject(obj_type="test", identity="", properties=props)
+        assert obj.properties["ElementChildNodesOfVersionHistory"] == ["oe-1"]
+        assert props == {"ElementChildNodesOfVersionHistory": "oe-1"}
+
+    def test_extracted_object_uses_slots(self):
+        obj = ExtractedObject(obj_type="test", identity="<ExtendedGUID> (g-1, 7)")
+        assert not hasattr(obj, "__dict__")
+        assert not hasattr(ExtractedPage(), "__dict__")
+
+    def test_extracted_object_pickles(self):
+        """Objects cross the worker-process boundary when parsing in parallel."""
+        obj = ExtractedObject(
+            obj_type="test", identity="<ExtendedGUID> (g-1, 7)", properties={"a": 1}
+        )
+        clone = pickle.loads(pickle.dumps(obj))
+        assert clone == obj
+        assert clone.guid == "g-1"
+
     def test_extracted_object_with_properties(self):
         props = {"Bold": True, "Font": "Arial"}
         obj = ExtractedObject(obj_type="text", identity="id-2", properties=props)
@@ -133,3 +145,57 @@ class TestExtractedDataclasses:
         assert section.file_path == "/test.one"
         assert section.display_name == "Test Section"
         assert len(section.pages) == 1
+
+
+def _obj(obj_type: str, guid: str, n: int, **properties: object) -> ExtractedObject:
+    return ExtractedObject(
+        obj_type=obj_type,
+        identity=f"<ExtendedGUID> ({guid}, {n})",
+        properties=properties,
+    )
+
+
+class TestBuildPages:
+    """Tests for OneStoreParser._build_pages."""
+
+    def _build(self, objects: list[ExtractedObject]) -> list[ExtractedPage]:
+        return OneStoreParser("unused.one")._build_pages(objects)
+
+    def test_page_per_page_node_guid(self):
+        pages = self._build(
+            [
+                _obj("jcidPageMetaData", "a", 1, CachedTitleString="First"),
+                _obj("jcidPageNode", "a", 2, Author="Ann"),
+                _obj("jcidRichTextOENode", "a", 3),
+                _obj("jcidPageMetaData", "b", 1, CachedTitleString="Second"),
+                _obj("jcidPageNode", "b", 2),
+                _obj("jcidPageNode", "b", 3, Author="ignored"),
+                _obj("jcidImageNode", "b", 4),
+            ]
+        )
+        assert [(p.title, p.author) for p in pages] == [
+            ("First", "Ann"),
+            ("Second", ""),
+        ]
+        assert [o.obj_type for o in pages[0].objects] == ["jcidRichTextOENode"]
+        assert [o.obj_type for o in pages[1].objects] == ["jcidImageNode"]
+
+    def test_newest_meta_wins_and_orphans_fill_in(self):
+        pages = self._build(
+            [
+                _obj("jcidPageMetaData", "a", 1, CachedTitleString="Old"),
+                _obj("jcidPageMetaData", "a", 2, CachedTitleString="New"),
+                _obj("jcidPageMetaData", "orphan", 1, CachedTitleString="Orphan"),
+                _obj("jcidPageNode", "a", 3),
+                _obj("jcidPageNode", "c", 1),
+                _obj("jcidPageNode", "d", 1),
+            ]
+        )
+        assert [p.title for p in pages] == ["New", "Orphan", "Untitled"]
+
+    def test_no_metadata_yields_single_page(self):
+        pages = self._build(
+            [_obj("jcidRichTextOENode", "a", 1), _obj("jcidSectionNode", "a", 2)]
+        )
+        assert len(pages) == 1
+        assert [o.obj_type for o in pages[0].objects] == ["jcidRichTextOENode"]
@@ -1,12 +1,19 @@
 """Tests for onenote_export.utils module."""
 
+import os
+import stat
 from pathlib import Path
 
+import pytest
 
 from onenote_export.utils import (
+    bytes_from_repr,
     discover_one_files,
     notebook_name_from_dir,
+    parse_int_prop,
+    section_date_from_filename,
     section_name_from_filename,
+    write_file,
 )
 
 
@@ -40,6 +47,41 @@ class TestSectionNameFromFilename:
     def test_multi_digit_date(self):
         assert section_name_from_filename("BMS (On 12-31-99).one") == "BMS"
 
+    def test_full_path(self):
+        assert section_name_from_filename("/path/to/Notes.one") == "Notes"
+        assert section_name_from_filename("/path/to/ADI (On 2-25-26).one") == "ADI"
+        assert section_name_from_filename("/path/to/.one") == "Untitled"
+
+    def test_date_with_dash_suffix(self):
+        assert section_name_from_filename("Section (On 2-25-26 - 3).one") == "Section"
+
+    def test_uppercase_dotone_before_date(self):
+        assert section_name_from_filename("ADP.ONE (On 8-24-25).one") == "ADP"
+
+    def test_parenthesised_text_without_date_kept(self):
+        assert section_name_from_filename("Notes (On hold).one") == "Notes (On hold)"
+
+
+class TestSectionDateFromFilename:
+    """Tests for section_date_from_filename."""
+
+    def test_dated_filename(self):
+        assert section_date_from_filename("ADI (On 2-25-26).one") == (2026, 2, 25)
+
+    def test_dotone_and_dash_suffix(self):
+        name = "ADP.one (On 10-3-22 - 2).one"
+        assert section_date_from_filename(name) == (2022, 10, 3)
+
+    def test_two_digit_years_split_at_fifty(self):
+        assert section_date_from_filename("A (On 1-1-49).one")[0] == 2049
+        assert section_date_from_filename("A (On 1-1-50).one")[0] == 1950
+
+    def test_four_digit_year_kept(self):
+        assert section_date_from_filename("A (On 1-2-2024).one") == (2024, 1, 2)
+
+    def test_undated_filename(self):
+        assert section_date_from_filename("Notes.one") == (0, 0, 0)
+
 
 class TestNotebookNameFromDir:
     """Tests for notebook_name_from_dir."""
@@ -52,6 +94,82 @@ class TestNotebookNameFromDir:
         assert notebook_name_from_dir(Path("/")) == "Untitled"
 
 
+class TestParseIntProp:
+    """Tests for parse_int_prop."""
+
+    def test_int_value(self):
+        assert parse_int_prop(42) == 42
+
+    def test_zero(self):
+        assert parse_int_prop(0) == 0
+
+    def test_negative_int(self):
+        assert parse_int_prop(-1) == -1
+
+    def test_bytes_value(self):
+        raw = (100).to_bytes(4, "little")
+        assert parse_int_prop(raw) == 100
+
+    def test_bytes_short(self):
+        raw = (5).to_bytes(2, "little")
+        assert parse_int_prop(raw) == 5
+
+    def test_bytes_width(self):
+        raw = (14).to_bytes(2, "little") + b"\xff\xff"
+        assert parse_int_prop(raw, width=2) == 14
+
+    def test_bytes_longer_than_width(self):
+        raw = (0x12345678).to_bytes(4, "little") + b"\xff" * 4
+        assert parse_int_prop(raw) == 0x12345678
+
+    def test_unusual_width(self):
+        assert parse_int_prop(b"\x01\x02\x03\x04", width=3) == 0x030201
+
+    def test_single_byte(self):
+        assert parse_int_prop(b"\x0e", width=2) == 14
+
+    def test_empty_bytes(self):
+        assert parse_int_prop(b"") == 0
+
+    def test_string_with_number(self):
+        assert parse_int_prop("size: 12pt") == 12
+        assert parse_int_prop("level: 3") == 3
+
+    def test_string_no_number(self):
+        assert parse_int_prop("none") == 0
+
+    def test_empty_string(self):
+        assert parse_int_prop("") == 0
+
+    def test_none(self):
+        assert parse_int_prop(None) == 0
+
+    def test_bytes_repr_string(self):
+        """pyOneNote returns e.g. RowCount as the repr() of its bytes."""
+        assert parse_int_prop("b'\\x0c\\x00\\x00\\x00'") == 12
+        assert parse_int_prop("b'\\n\\x00\\x00\\x00'") == 10
+        assert parse_int_prop("b'\\x16\\x00'", width=2) == 22
+
+    def test_bool_is_int(self):
+        assert parse_int_prop(True) == 1
+
+
+class TestBytesFromRepr:
+    """Tests for bytes_from_repr."""
+
+    def test_round_trips_repr(self):
+        for raw in (b"$\x00", b"\x04\x00", b"'\"\\", b"\n\t\xff"):
+            assert bytes_from_repr(repr(raw)) == raw
+
+    def test_malformed_returns_none(self):
+        for value in ("b'\\x0'", "b'", "b'a' + b'b'", "b'\u00e9'", "'ab'"):
+            assert bytes_from_repr(value) is None
+
+    def test_malformed_escapes_return_none(self):
+        for value in ("b'\\'", "b'\\x'", "b'\\xg0'", "b'ab\\'"):
+            assert bytes_from_repr(value) is None
+
+
 class TestDiscoverOneFiles:
     """Tests for discover_one_files."""
 
@@ -85,3 +203,71 @@ class TestDiscoverOneFiles:
         result = discover_one_files(tmp_path)
         assert result[0].name == "a_section.one"
         assert result[1].name == "b_section.one"
+
+    def test_matches_extension_case_insensitively(self, tmp_path):
+        (tmp_path / "Section.ONE").touch()
+        result = discover_one_files(tmp_path)
+        assert [p.name for p in result] == ["Section.ONE"]
+
+    def test_ignores_directories_named_like_one_files(self, tmp_path):
+        (tmp_path / "folder.one").mkdir()
+        (tmp_path / "folder.one" / "inner.one").touch()
+        result = discover_one_files(tmp_path)
+        assert [p.name for p in result] == ["inner.one"]
+
+    def test_does_not_follow_directory_symlinks(self, tmp_path):
+        real = tmp_path / "real"
+        real.mkdir()
+        (real / "section.one").touch()
+        try:
+            (tmp_path / "link").symlink_to(real, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported on this platform")
+        result = discover_one_files(tmp_path)
+        assert result == [real / "section.one"]
+
+    def test_finds_files_at_every_depth(self, tmp_path):
+        deep = tmp_path.joinpath(*["d"] * 30)
+        deep.mkdir(parents=True)
+        (deep / "deep.one").touch()
+        (tmp_path / "d" / "shallow.one").touch()
+        result = discover_one_files(tmp_path)
+        assert result == [deep / "deep.one", tmp_path / "d" / "shallow.one"]
+
+
+class TestWriteFile:
+    """Tests for write_file."""
+
+    def test_creates_file(self, tmp_path):
+        path = tmp_path / "out.bin"
+        write_file(path, b"\x00\x01data")
+        assert path.read_bytes() == b"\x00\x01data"
+
+    def test_truncates_existing_file(self, tmp_path):
+        path = tmp_path / "out.md"
+        path.write_bytes(b"a much longer previous content")
+        write_file(path, b"short")
+        assert path.read_bytes() == b"short"
+
+    def test_newlines_written_verbatim(self, tmp_path):
+        path = tmp_path / "out.md"
+        write_file(path, b"line 1\nline 2\n")
+        assert path.read_bytes() == b"line 1\nline 2\n"
+
+    def test_empty_data(self, tmp_path):
+        path = tmp_path / "empty"
+        write_file(path, b"")
+        assert path.read_bytes() == b""
+
+    def test_missing_directory_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            write_file(tmp_path / "missing" / "out.md", b"x")
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_new_file_mode_follows_umask(self, tmp_path):
+        old_umask = os.umask(0o002)
+        try:
+            write_file(tmp_path / "out.md", b"x")
+        finally:
+            os.umask(old_umask)
+        assert stat.S_IMODE((tmp_path / "out.md").stat().st_mode) == 0o664